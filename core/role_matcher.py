@@ -3,18 +3,71 @@ Role Matching System for Multiple Job Descriptions
 Compares resumes against multiple job descriptions and ranks matches
 """
 
+import re
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, FrozenSet
 from dataclasses import dataclass, asdict
+from datetime import date
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, Counter
+from itertools import chain, islice
+from operator import attrgetter
 import json
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keyword tokens (4+ word characters) used for experience relevance overlap
+_WORD4_RE = re.compile(r'\b\w{4,}\b')
+
+# Year ranges ("2019 - 2022", "2020 to present") or explicit durations ("3 years")
+_EXP_YEARS_RE = re.compile(r'(\d{4})\s*(?:-|to)\s*(\d{4}|present|current)|(\d+)\s*years?', re.IGNORECASE)
+_CURRENT_YEAR = date.today().year
+
+# Minimum years of experience stated in a job description
+_YEARS_REQUIRED_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)')
+
+# Degree keywords grouped by education level; the matching group's index
+# gives the level (group 1 = doctorate ... group 4 = associate/diploma)
+_EDU_RE = re.compile(
+    r'\b(?:(phd|ph\.d|doctorate)'
+    r'|(masters?|mba|ms|ma)'
+    r'|(bachelors?|bs|ba|btech|be)'
+    r'|(associate|diploma|certificate))\b'
+)
+_EDU_LEVELS = {1: 4, 2: 3, 3: 2, 4: 1}
+
+# Job title keywords by category, scanned in a single pass by _categorize_job
+_JOB_CAT_RE = re.compile(
+    r'(?P<devops>devops|sre|infrastructure)'
+    r'|(?P<platform>platform)'
+    r'|(?P<data>data scientist|ml engineer|\bai\b)'
+    r'|(?P<pm>product manager|\bpm\b|product owner)'
+    r'|(?P<swe>software|developer|engineer|programmer)'
+)
+
+# Supported prioritization criteria for ranking job matches
+_SORT_KEYS = {
+    'match_score': attrgetter('match_score'),
+    'selection_probability': attrgetter('selection_probability'),
+    'skill_overlap': attrgetter('skill_overlap')
+}
+
+# Priority buckets: a job's priority is the lower of its match-score bucket
+# and its selection-probability bucket (0 = low, 1 = medium, 2 = high)
+_PRIORITY_LEVELS = np.array(['low', 'medium', 'high'])
+_MATCH_SCORE_THRESHOLDS = np.array([0.6, 0.8])
+_SELECTION_PROB_THRESHOLDS = np.array([0.5, 0.7])
+
+@dataclass(slots=True, frozen=True)
 class JobMatch:
     """Represents a match between resume and job description"""
     job_id: str
@@ -31,7 +84,7 @@ class JobMatch:
     recommendation: str
     priority_level: str  # 'high', 'medium', 'low'
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoleMatchingResults:
     """Complete role matching analysis results"""
     total_jobs_analyzed: int
@@ -86,6 +139,16 @@ class RoleMatcher:
             }
         }
         
+        # Component weight rows (semantic, skills, experience, education) per category
+        self._category_weight_rows = {
+            category: np.array([
+                weights['other_weight'], weights['skills_weight'],
+                weights['experience_weight'], weights['education_weight']
+            ])
+            for category, weights in self.job_categories.items()
+        }
+        self._default_weight_row = np.array([0.1, 0.4, 0.3, 0.2])
+        
         # Industry salary ranges (for prioritization)
         self.salary_ranges = {
             'software_engineer': {'min': 80000, 'max': 200000, 'median': 120000},
@@ -101,31 +164,46 @@ class RoleMatcher:
                             prioritize_by: str = 'match_score') -> RoleMatchingResults:
         """Analyze resume against multiple job descriptions"""
         
-        job_matches = []
-        skill_gaps = defaultdict(int)
+        scored_jobs = []
+        skill_gaps = Counter()
         
         logger.info(f"Analyzing resume against {len(job_descriptions)} job descriptions")
         
-        for job in job_descriptions:
+        # Resume-side features are constant across jobs, so compute them once
+        resume_features = self._extract_resume_features(resume_data)
+        
+        # Lowercase and tokenize every job description in one pass up front
+        job_texts = [self._tokenize_job_description(job.get('description', '')) for job in job_descriptions]
+        
+        for job, job_text in zip(job_descriptions, job_texts):
             try:
-                match = self._analyze_single_job_match(resume_data, job)
-                job_matches.append(match)
-                
-                # Aggregate skill gaps
-                for skill in match.missing_skills:
-                    skill_gaps[skill] += 1
-                    
+                scored_jobs.append(
+                    self._score_job_components(resume_data, job, resume_features, job_text)
+                )
             except Exception as e:
                 logger.error(f"Error analyzing job {job.get('job_id', 'unknown')}: {e}")
                 continue
         
+        self._finalize_job_scores(resume_data, scored_jobs)
+        
+        # Bucket all jobs into priority levels in one vectorized pass
+        priority_levels = self._assign_priority_levels(
+            [scored['match_score'] for scored in scored_jobs],
+            [scored['selection_probability'] for scored in scored_jobs]
+        )
+        job_matches = [
+            self._build_job_match(scored, priority_level)
+            for scored, priority_level in zip(scored_jobs, priority_levels)
+        ]
+        
+        # Aggregate skill gaps
+        for match in job_matches:
+            skill_gaps.update(match.missing_skills)
+        
         # Sort matches based on prioritization criteria
-        if prioritize_by == 'match_score':
-            job_matches.sort(key=lambda x: x.match_score, reverse=True)
-        elif prioritize_by == 'selection_probability':
-            job_matches.sort(key=lambda x: x.selection_probability, reverse=True)
-        elif prioritize_by == 'skill_overlap':
-            job_matches.sort(key=lambda x: x.skill_overlap, reverse=True)
+        sort_key = _SORT_KEYS.get(prioritize_by)
+        if sort_key is not None:
+            job_matches.sort(key=sort_key, reverse=True)
         
         # Generate insights and recommendations
         career_insights = self._generate_career_insights(job_matches, resume_data)
@@ -135,22 +213,65 @@ class RoleMatcher:
         return RoleMatchingResults(
             total_jobs_analyzed=len(job_descriptions),
             best_matches=job_matches,
-            skill_gap_summary=dict(skill_gaps),
+            skill_gap_summary=dict(skill_gaps.most_common()),
             recommended_actions=recommended_actions,
             career_insights=career_insights,
             match_distribution=match_distribution
         )
 
-    def _analyze_single_job_match(self, resume_data: Dict[str, Any], job: Dict[str, str]) -> JobMatch:
+    def _extract_resume_features(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute resume-derived values that do not depend on the job"""
+        
+        experience_list = resume_data.get('experience', [])
+        experience_text = ' '.join(experience_list).lower()
+        education_text = ' '.join(resume_data.get('education', [])).lower()
+        
+        return {
+            'experience_tokens': frozenset(_WORD4_RE.findall(experience_text)),
+            'years_experience': self._estimate_years_experience(experience_list),
+            'education_level': self._extract_edu_level(education_text)
+        }
+
+    def _analyze_single_job_match(self, 
+                                  resume_data: Dict[str, Any],
+                                  job: Dict[str, str],
+                                  resume_features: Optional[Dict[str, Any]] = None) -> JobMatch:
         """Analyze match between resume and single job description"""
         
-        job_id = job.get('job_id', f"job_{hash(job.get('description', ''))}")
+        scored = self._score_job_components(resume_data, job, resume_features)
+        self._finalize_job_scores(resume_data, [scored])
+        priority_level = self._assign_priority_levels(
+            [scored['match_score']], [scored['selection_probability']]
+        )[0]
+        
+        return self._build_job_match(scored, priority_level)
+
+    def _score_job_components(self, 
+                              resume_data: Dict[str, Any],
+                              job: Dict[str, str],
+                              resume_features: Optional[Dict[str, Any]] = None,
+                              job_text: Optional[Tuple[str, FrozenSet[str]]] = None) -> Dict[str, Any]:
+        """Compute the individual component scores for one job"""
+        
+        if resume_features is None:
+            resume_features = self._extract_resume_features(resume_data)
+        
         job_title = job.get('title', 'Unknown Position')
         company = job.get('company', 'Unknown Company')
         job_description = job.get('description', '')
         
+        # Stable across processes (unlike hash()), so IDs can key persistent caches
+        job_id = job.get('job_id') or (
+            f"job_{hashlib.blake2b(job_description.encode('utf-8'), digest_size=8).hexdigest()}"
+        )
+        
         resume_text = resume_data.get('cleaned_text', '')
         
+        # Lowercased description and keyword set shared by all component scores
+        if job_text is None:
+            job_text = self._tokenize_job_description(job_description)
+        job_desc_lower, job_keywords = job_text
+        
         # 1. Calculate semantic similarity
         semantic_similarity = self.nlp_engine.compute_semantic_similarity(
             resume_text, job_description
@@ -163,42 +284,80 @@ class RoleMatcher:
         
         # 3. Calculate component scores
         skill_overlap = self._calculate_skill_overlap(skill_analysis)
-        experience_match = self._calculate_experience_match(resume_data, job_description)
-        education_match = self._calculate_education_match(resume_data, job_description)
-        
-        # 4. Calculate overall match score
-        match_score = self._calculate_weighted_match_score(
-            semantic_similarity, skill_overlap, experience_match, 
-            education_match, job_title
+        experience_match = self._calculate_experience_match(
+            resume_data, job_desc_lower, resume_features, job_keywords
         )
+        education_match = self._calculate_education_match(
+            resume_data, job_desc_lower, resume_features
+        )
+        
+        return {
+            'job_id': job_id,
+            'job_title': job_title,
+            'company': company,
+            'job_description': job_description,
+            'skill_overlap': skill_overlap,
+            'experience_match': experience_match,
+            'education_match': education_match,
+            'semantic_similarity': semantic_similarity,
+            'skill_analysis': skill_analysis,
+            'matched_skills': [skill.skill for skill in skill_analysis.matched_skills]
+        }
+
+    def _finalize_job_scores(self, resume_data: Dict[str, Any], scored_jobs: List[Dict[str, Any]]):
+        """Add overall match score and selection probability to scored jobs"""
+        
+        # 4. Calculate overall match scores for the whole batch
+        match_scores = self._calculate_weighted_match_scores(scored_jobs)
         
         # 5. Predict selection probability
-        selection_probability = self._predict_selection_probability(
-            resume_data, job_description, skill_analysis, match_score
-        )
+        for scored, match_score in zip(scored_jobs, match_scores.tolist()):
+            scored['match_score'] = match_score
+            scored['selection_probability'] = self._predict_selection_probability(
+                resume_data, scored['job_description'], scored['skill_analysis'],
+                match_score, scored['matched_skills']
+            )
+
+    def _tokenize_job_description(self, job_description: str) -> Tuple[str, FrozenSet[str]]:
+        """Lowercase a job description and extract its keyword set"""
         
-        # 6. Generate recommendation and priority
-        recommendation, priority_level = self._generate_job_recommendation(
-            match_score, selection_probability, skill_analysis
-        )
+        job_desc_lower = job_description.lower()
+        return job_desc_lower, frozenset(_WORD4_RE.findall(job_desc_lower))
+
+    def _build_job_match(self, scored: Dict[str, Any], priority_level: str) -> JobMatch:
+        """Create the JobMatch for a scored job once its priority is known"""
+        
+        skill_analysis = scored['skill_analysis']
         
         return JobMatch(
-            job_id=job_id,
-            job_title=job_title,
-            company=company,
-            match_score=match_score,
-            skill_overlap=skill_overlap,
-            experience_match=experience_match,
-            education_match=education_match,
-            semantic_similarity=semantic_similarity,
-            missing_skills=skill_analysis.critical_gaps + 
-                          [skill.skill for skill in skill_analysis.missing_skills[:5]],
-            matched_skills=[skill.skill for skill in skill_analysis.matched_skills],
-            selection_probability=selection_probability,
-            recommendation=recommendation,
+            job_id=scored['job_id'],
+            job_title=scored['job_title'],
+            company=scored['company'],
+            match_score=scored['match_score'],
+            skill_overlap=scored['skill_overlap'],
+            experience_match=scored['experience_match'],
+            education_match=scored['education_match'],
+            semantic_similarity=scored['semantic_similarity'],
+            missing_skills=list(chain(
+                skill_analysis.critical_gaps,
+                (skill.skill for skill in islice(skill_analysis.missing_skills, 5))
+            )),
+            matched_skills=scored['matched_skills'],
+            selection_probability=scored['selection_probability'],
+            recommendation=self._generate_job_recommendation(priority_level, skill_analysis),
             priority_level=priority_level
         )
 
+    def _assign_priority_levels(self, 
+                                match_scores: List[float],
+                                selection_probabilities: List[float]) -> List[str]:
+        """Assign 'high'/'medium'/'low' priority to each job in one vectorized pass"""
+        
+        match_bins = np.searchsorted(_MATCH_SCORE_THRESHOLDS, match_scores, side='right')
+        prob_bins = np.searchsorted(_SELECTION_PROB_THRESHOLDS, selection_probabilities, side='right')
+        
+        return np.take(_PRIORITY_LEVELS, np.minimum(match_bins, prob_bins)).tolist()
+
     def _calculate_skill_overlap(self, skill_analysis) -> float:
         """Calculate skill overlap percentage"""
         
@@ -208,27 +367,29 @@ class RoleMatcher:
         
         return len(skill_analysis.matched_skills) / total_skills
 
-    def _calculate_experience_match(self, resume_data: Dict[str, Any], job_description: str) -> float:
-        """Calculate experience match score"""
+    def _calculate_experience_match(self, 
+                                    resume_data: Dict[str, Any],
+                                    job_desc_lower: str,
+                                    resume_features: Optional[Dict[str, Any]] = None,
+                                    job_keywords: Optional[FrozenSet[str]] = None) -> float:
+        """Calculate experience match score against a lowercased job description"""
         
         experience_list = resume_data.get('experience', [])
         if not experience_list:
             return 0.0
         
-        experience_text = ' '.join(experience_list).lower()
-        job_desc_lower = job_description.lower()
+        if resume_features is None:
+            resume_features = self._extract_resume_features(resume_data)
         
         # Extract years of experience required
-        import re
-        years_required_pattern = r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)'
-        years_matches = re.findall(years_required_pattern, job_desc_lower)
+        years_matches = _YEARS_REQUIRED_RE.findall(job_desc_lower)
         
         required_years = 0
         if years_matches:
             required_years = int(years_matches[0])
         
-        # Estimate candidate's years of experience
-        candidate_years = self._estimate_years_experience(experience_list)
+        # Candidate's years of experience (precomputed once per resume)
+        candidate_years = resume_features['years_experience']
         
         # Calculate experience match
         if required_years == 0:
@@ -241,8 +402,9 @@ class RoleMatcher:
             experience_score = candidate_years / required_years
         
         # Check for relevant experience keywords
-        job_keywords = set(re.findall(r'\b\w{4,}\b', job_desc_lower))
-        exp_keywords = set(re.findall(r'\b\w{4,}\b', experience_text))
+        if job_keywords is None:
+            job_keywords = frozenset(_WORD4_RE.findall(job_desc_lower))
+        exp_keywords = resume_features['experience_tokens']
         
         keyword_overlap = len(job_keywords & exp_keywords) / len(job_keywords) if job_keywords else 0
         
@@ -251,35 +413,22 @@ class RoleMatcher:
         
         return min(1.0, final_score)
 
-    def _calculate_education_match(self, resume_data: Dict[str, Any], job_description: str) -> float:
-        """Calculate education match score"""
+    def _calculate_education_match(self, 
+                                   resume_data: Dict[str, Any],
+                                   job_desc_lower: str,
+                                   resume_features: Optional[Dict[str, Any]] = None) -> float:
+        """Calculate education match score against a lowercased job description"""
         
         education_list = resume_data.get('education', [])
         if not education_list:
             return 0.3  # Some score for missing education
         
-        education_text = ' '.join(education_list).lower()
-        job_desc_lower = job_description.lower()
-        
-        # Education level mapping
-        education_levels = {
-            'phd': 4, 'doctorate': 4, 'ph.d': 4,
-            'master': 3, 'mba': 3, 'ms': 3, 'ma': 3,
-            'bachelor': 2, 'bs': 2, 'ba': 2, 'btech': 2, 'be': 2,
-            'associate': 1, 'diploma': 1, 'certificate': 1
-        }
-        
-        # Determine candidate's education level
-        candidate_level = 0
-        for degree, level in education_levels.items():
-            if degree in education_text:
-                candidate_level = max(candidate_level, level)
+        if resume_features is None:
+            resume_features = self._extract_resume_features(resume_data)
         
-        # Determine required education level
-        required_level = 0
-        for degree, level in education_levels.items():
-            if degree in job_desc_lower:
-                required_level = max(required_level, level)
+        # Candidate's level is precomputed once per resume
+        candidate_level = resume_features['education_level']
+        required_level = self._extract_edu_level(job_desc_lower)
         
         # Calculate match score
         if required_level == 0:
@@ -291,42 +440,30 @@ class RoleMatcher:
         else:
             return max(0.3, candidate_level / required_level)
 
+    def _extract_edu_level(self, text_lower: str) -> int:
+        """Highest education level (0-4) mentioned in lowercased text"""
+        
+        return max((_EDU_LEVELS[m.lastindex] for m in _EDU_RE.finditer(text_lower)), default=0)
+
     def _estimate_years_experience(self, experience_list: List[str]) -> float:
         """Estimate years of experience from experience descriptions"""
         
-        import re
+        range_starts = []
+        range_ends = []
         total_years = 0.0
         
+        # One scan per entry; ranges are collected and summed in a single numpy pass
         for exp in experience_list:
-            # Look for explicit year mentions
-            year_patterns = [
-                r'(\d+)\s*years?',
-                r'(\d{4})\s*-\s*(\d{4})',
-                r'(\d{4})\s*to\s*(\d{4})',
-                r'(\d{4})\s*-\s*present',
-                r'(\d{4})\s*-\s*current'
-            ]
-            
-            for pattern in year_patterns:
-                matches = re.findall(pattern, exp, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        if len(match) == 2:
-                            try:
-                                start_year = int(match[0])
-                                if 'present' in match[1].lower() or 'current' in match[1].lower():
-                                    end_year = 2024  # Current year
-                                else:
-                                    end_year = int(match[1])
-                                years = end_year - start_year
-                                total_years += max(0, years)
-                            except ValueError:
-                                continue
-                    else:
-                        try:
-                            total_years += int(match)
-                        except ValueError:
-                            continue
+            for start, end, duration in _EXP_YEARS_RE.findall(exp):
+                if duration:
+                    total_years += int(duration)
+                else:
+                    range_starts.append(int(start))
+                    range_ends.append(_CURRENT_YEAR if not end.isdigit() else int(end))
+        
+        if range_starts:
+            spans = np.array(range_ends, dtype=np.int32) - np.array(range_starts, dtype=np.int32)
+            total_years += float(np.clip(spans, 0, None).sum())
         
         # If no explicit years found, estimate based on number of positions
         if total_years == 0:
@@ -334,47 +471,40 @@ class RoleMatcher:
         
         return min(total_years, 25)  # Cap at 25 years
 
-    def _calculate_weighted_match_score(self, 
-                                      semantic_similarity: float,
-                                      skill_overlap: float,
-                                      experience_match: float,
-                                      education_match: float,
-                                      job_title: str) -> float:
-        """Calculate weighted match score based on job category"""
-        
-        # Determine job category
-        job_category = self._categorize_job(job_title)
-        weights = self.job_categories.get(job_category, {
-            'experience_weight': 0.3,
-            'skills_weight': 0.4,
-            'education_weight': 0.2,
-            'other_weight': 0.1
-        })
-        
-        # Calculate weighted score
-        weighted_score = (
-            semantic_similarity * weights['other_weight'] +
-            skill_overlap * weights['skills_weight'] +
-            experience_match * weights['experience_weight'] +
-            education_match * weights['education_weight']
-        )
+    def _calculate_weighted_match_scores(self, scored_jobs: List[Dict[str, Any]]) -> np.ndarray:
+        """Calculate weighted match scores based on job category for a batch of jobs"""
+        
+        # (N, 4) component matrix against (N, 4) per-category weight rows
+        components = np.array([
+            [scored['semantic_similarity'], scored['skill_overlap'],
+             scored['experience_match'], scored['education_match']]
+            for scored in scored_jobs
+        ], dtype=float).reshape(-1, 4)
+        weights = np.array([
+            self._category_weight_rows.get(
+                self._categorize_job(scored['job_title']), self._default_weight_row
+            )
+            for scored in scored_jobs
+        ]).reshape(-1, 4)
         
-        return min(1.0, weighted_score)
+        return np.minimum(1.0, (components * weights).sum(axis=1))
 
-    def _categorize_job(self, job_title: str) -> str:
-        """Categorize job based on title"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _categorize_job(job_title: str) -> str:
+        """Categorize job based on title (memoized per unique title)"""
         
-        title_lower = job_title.lower()
+        hits = {m.lastgroup for m in _JOB_CAT_RE.finditer(job_title.lower())}
         
-        if any(term in title_lower for term in ['software', 'developer', 'engineer', 'programmer']):
-            if any(term in title_lower for term in ['devops', 'sre', 'infrastructure', 'platform']):
+        if 'swe' in hits:
+            if 'devops' in hits or 'platform' in hits:
                 return 'devops_engineer'
             return 'software_engineer'
-        elif any(term in title_lower for term in ['data scientist', 'ml engineer', 'ai']):
+        elif 'data' in hits:
             return 'data_scientist'
-        elif any(term in title_lower for term in ['product manager', 'pm', 'product owner']):
+        elif 'pm' in hits:
             return 'product_manager'
-        elif any(term in title_lower for term in ['devops', 'sre', 'infrastructure']):
+        elif 'devops' in hits:
             return 'devops_engineer'
         else:
             return 'general'
@@ -383,14 +513,18 @@ class RoleMatcher:
                                      resume_data: Dict[str, Any],
                                      job_description: str,
                                      skill_analysis,
-                                     match_score: float) -> float:
+                                     match_score: float,
+                                     matched_skill_names: Optional[List[str]] = None) -> float:
         """Predict selection probability using the prediction model"""
         
+        if matched_skill_names is None:
+            matched_skill_names = [skill.skill for skill in skill_analysis.matched_skills]
+        
         try:
             # Extract features for prediction
             features = self.prediction_model.extract_features(
                 resume_data, job_description, match_score, {
-                    'matched_skills': [skill.skill for skill in skill_analysis.matched_skills],
+                    'matched_skills': matched_skill_names,
                     'missing_skills': [skill.skill for skill in skill_analysis.missing_skills]
                 }
             )
@@ -404,32 +538,25 @@ class RoleMatcher:
             # Fallback to match score
             return match_score * 0.8
 
-    def _generate_job_recommendation(self, 
-                                   match_score: float,
-                                   selection_probability: float,
-                                   skill_analysis) -> Tuple[str, str]:
-        """Generate recommendation and priority level for job"""
+    def _generate_job_recommendation(self, priority: str, skill_analysis) -> str:
+        """Generate recommendation text for a job's priority level"""
         
-        # Determine priority level
-        if match_score >= 0.8 and selection_probability >= 0.7:
-            priority = 'high'
+        if priority == 'high':
             recommendation = "Excellent match! Apply immediately. You meet most requirements."
-        elif match_score >= 0.6 and selection_probability >= 0.5:
-            priority = 'medium'
+        elif priority == 'medium':
             missing_count = len(skill_analysis.missing_skills)
             if missing_count <= 2:
                 recommendation = f"Good match. Consider applying after addressing {missing_count} missing skills."
             else:
                 recommendation = f"Moderate match. Focus on acquiring key skills: {', '.join([s.skill for s in skill_analysis.missing_skills[:2]])}."
         else:
-            priority = 'low'
             critical_gaps = len(skill_analysis.critical_gaps)
             if critical_gaps > 0:
                 recommendation = f"Significant skill gaps. Focus on critical skills: {', '.join(skill_analysis.critical_gaps[:2])}."
             else:
                 recommendation = "Limited match. Consider this role for future career growth after skill development."
         
-        return recommendation, priority
+        return recommendation
 
     def _generate_career_insights(self, job_matches: List[JobMatch], resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate career insights from job matching results"""
@@ -448,20 +575,9 @@ class RoleMatcher:
             for match in job_matches[:5]
         ]
         
-        # Skill demand analysis
-        all_missing_skills = []
-        for match in job_matches:
-            all_missing_skills.extend(match.missing_skills)
-        
-        skill_demand = {}
-        for skill in set(all_missing_skills):
-            count = all_missing_skills.count(skill)
-            skill_demand[skill] = count
-        
-        # Sort by demand
-        insights['skill_demand_analysis'] = dict(
-            sorted(skill_demand.items(), key=lambda x: x[1], reverse=True)[:10]
-        )
+        # Skill demand analysis (single-pass tally, top 10 by demand)
+        skill_demand = Counter(chain.from_iterable(match.missing_skills for match in job_matches))
+        insights['skill_demand_analysis'] = dict(skill_demand.most_common(10))
         
         # Career progression suggestions
         high_match_roles = [match for match in job_matches if match.match_score >= 0.7]
@@ -489,7 +605,7 @@ class RoleMatcher:
         
         return insights
 
-    def _generate_recommended_actions(self, job_matches: List[JobMatch], skill_gaps: Dict[str, int]) -> List[str]:
+    def _generate_recommended_actions(self, job_matches: List[JobMatch], skill_gaps: Counter) -> List[str]:
         """Generate recommended actions based on analysis"""
         
         actions = []
@@ -500,7 +616,7 @@ class RoleMatcher:
             actions.append(f"Apply immediately to {len(high_priority_jobs)} high-match positions")
         
         # Skill development priorities
-        top_missing_skills = sorted(skill_gaps.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_missing_skills = skill_gaps.most_common(3)
         if top_missing_skills:
             skills_list = [skill for skill, count in top_missing_skills]
             actions.append(f"Prioritize learning: {', '.join(skills_list)}")
@@ -536,6 +652,13 @@ class RoleMatcher:
         """Export role matching results"""
         
         if format == 'json':
+            if orjson is not None:
+                # Serializes the dataclass tree directly, without an asdict() copy
+                return orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ).decode()
             return json.dumps(asdict(results), indent=2, default=str)
         
         elif format == 'summary':
@@ -578,6 +701,6 @@ MARKET READINESS: {results.career_insights.get('market_readiness', 'Unknown')}
         
         # Sort each category by match score
         for category in categories:
-            categories[category].sort(key=lambda x: x.match_score, reverse=True)
+            categories[category].sort(key=_SORT_KEYS['match_score'], reverse=True)
         
         return dict(categories)
@@ -5,18 +5,171 @@ Identifies missing skills, skill levels, and provides intelligent recommendation
 
 import re
 import json
+import string
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Optional, Set
-from dataclasses import dataclass, asdict
+import threading
+from typing import Dict, List, Tuple, Optional, Set, Iterable
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
-from collections import defaultdict, Counter
+import ahocorasick
+from collections import defaultdict, Counter, OrderedDict
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Confidence assigned to a skill found by its canonical name vs. by a synonym
+_EXACT_MATCH_CONFIDENCE = 0.9
+_SYNONYM_MATCH_CONFIDENCE = 0.8
+
+# Context cues that raise detection confidence when they directly precede
+# ("experience with python") or follow ("python for 3 years") a skill mention
+_CONTEXT_PREFIX_RE = re.compile(
+    r'(?:(experience\s+with)|(worked\s+with)|(proficient\s+in)|(expert\s+in)|(\d+\s+years?\s+of))\s+'
+)
+_CONTEXT_SUFFIX_RE = re.compile(r'\s+for\s+\d+\s+years?')
+_CONTEXT_SUFFIX_TYPE = 6
+_CONTEXT_BONUS = 0.1
+
+# Missing skills above this importance are reported as critical gaps
+_CRITICAL_GAP_IMPORTANCE = 0.7
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Punctuation that only separates words; '.', '+', '#' and '_' are kept because they
+# belong to skill names ("node.js", "c++", "c#") or to words
+_SEPARATOR_PUNCTUATION = ''.join(char for char in string.punctuation if char not in '.+#_')
+_SEPARATORS_TO_SPACE = str.maketrans(_SEPARATOR_PUNCTUATION, ' ' * len(_SEPARATOR_PUNCTUATION))
+
+# Punctuation dropped from free-form skill names (everything but '.', '-' and '_')
+_SKILL_NAME_STRIP = str.maketrans('', '', ''.join(char for char in string.punctuation if char not in '.-_'))
+_TEXT_SEPARATOR = '\x00'
+
+# Importance cues in a job description, found in one pass. A cue boosts a skill
+# mentioned later on the same line as the cue's end (e.g. "required: python");
+# a years cue also boosts a skill mentioned earlier on its own line ("python, 3+ years")
+# Zero-width scan so overlapping cues ("preferrequired") are all found
+_IMPORTANCE_CUE_RE = re.compile(
+    r'(?=require(d?\s*:?\s*)'
+    r'|(must\s+have)'
+    r'|preferre(d?\s*:?\s*)'
+    r'|(nice\s+to\s+have)'
+    r'|(essential|critical)'
+    r'|(\d+\+?\s+years?)(\s*))'
+)
+# Last group of each alternative -> cue kind; tail groups start where the cue word ends
+_IMPORTANCE_CUE_KINDS = {1: 'required', 2: 'required', 3: 'preferred', 4: 'preferred', 5: 'essential', 7: 'experience'}
+_IMPORTANCE_TAIL_GROUPS = {1, 3}
+_EXPERIENCE_CUE_GROUP = 7
+
+# Multiplier per importance cue kind, applied once per kind in this order
+_IMPORTANCE_MULTIPLIERS = {
+    'required': 1.2,
+    'preferred': 0.9,
+    'essential': 1.3,
+    'experience': 1.1
+}
+
+# Proficiency cues that directly precede a skill ("expert in python"), in order of precedence
+_LEVEL_PREFIX_CUES = (
+    ('advanced', (r'expert in', r'senior', r'lead', r'mastery of', r'\d+\+? years of')),
+    ('intermediate', (
+        r'proficient in', r'experienced with', r'solid understanding of', r'worked with', r'familiar with',
+    )),
+    ('beginner', (r'basic', r'introduction to', r'learning', r'exposure to')),
+)
+# One bit per level, highest bit = highest precedence (advanced=4, intermediate=2, beginner=1)
+_LEVEL_BITS = {level: 1 << (len(_LEVEL_PREFIX_CUES) - 1 - idx) for idx, (level, _) in enumerate(_LEVEL_PREFIX_CUES)}
+
+# Level for every combination of hit bits: the highest hit wins, no hits -> intermediate
+_LEVEL_BY_MASK = (
+    'intermediate', 'beginner', 'intermediate', 'intermediate',
+    'advanced', 'advanced', 'advanced', 'advanced'
+)
+
+# Zero-width scan so overlapping cues are all found; group index = level precedence
+_LEVEL_CUE_RE = re.compile(
+    '(?=' + '|'.join(f"((?:{'|'.join(cues)}) )" for _, cues in _LEVEL_PREFIX_CUES) + ')'
+)
+
+# Cue that directly follows a skill ("python architect")
+_LEVEL_SUFFIX_RE = re.compile(r'(?= architect)')
+_LEVEL_SUFFIX_BIT = _LEVEL_BITS['advanced']
+
+# Learning paths for common skills, built once instead of per call
+_LEARNING_PATHS = {
+    'React': {
+        'prerequisites': ['JavaScript', 'HTML', 'CSS'],
+        'core_concepts': ['Components', 'JSX', 'State Management', 'Props', 'Hooks'],
+        'advanced_topics': ['Redux', 'Context API', 'Testing', 'Performance Optimization'],
+        'projects': ['Todo App', 'Weather App', 'E-commerce Site']
+    },
+    'Python': {
+        'prerequisites': ['Programming Basics'],
+        'core_concepts': ['Syntax', 'Data Types', 'Functions', 'OOP', 'Modules'],
+        'advanced_topics': ['Web Frameworks', 'Data Science', 'Machine Learning'],
+        'projects': ['Calculator', 'Web Scraper', 'API Development']
+    },
+    'AWS': {
+        'prerequisites': ['Cloud Computing Basics', 'Linux'],
+        'core_concepts': ['EC2', 'S3', 'IAM', 'VPC', 'Lambda'],
+        'advanced_topics': ['EKS', 'CloudFormation', 'DevOps', 'Security'],
+        'projects': ['Static Website Hosting', 'Serverless API', 'CI/CD Pipeline']
+    },
+    'Machine Learning': {
+        'prerequisites': ['Python', 'Statistics', 'Linear Algebra'],
+        'core_concepts': ['Supervised Learning', 'Unsupervised Learning', 'Model Evaluation'],
+        'advanced_topics': ['Deep Learning', 'NLP', 'Computer Vision'],
+        'projects': ['Iris Classification', 'House Price Prediction', 'Image Recognition']
+    }
+}
+_DEFAULT_LEARNING_PATH = {
+    'prerequisites': ['Research the skill requirements'],
+    'core_concepts': ['Start with fundamentals'],
+    'advanced_topics': ['Explore advanced applications'],
+    'projects': ['Build practical projects']
+}
+
+# Bound on cached per-text scan results and per-(text, skill) level assessments
+_SCAN_CACHE_SIZE = 256
+_LEVEL_CACHE_SIZE = 4096
+
+
+def _text_digest(text: str) -> bytes:
+    """Compact cache key for a text, so cached entries don't hold the text itself"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+@dataclass(slots=True, frozen=True)
 class SkillMatch:
     """Represents a skill match between resume and job requirements"""
     skill: str
@@ -26,7 +179,7 @@ class SkillMatch:
     importance: float  # 0-1 scale based on job requirements
     alternatives: List[str] = None  # Alternative/related skills found
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillGapAnalysis:
     """Complete skill gap analysis results"""
     matched_skills: List[SkillMatch]
@@ -37,6 +190,40 @@ class SkillGapAnalysis:
     recommendations: List[str]
     skill_level_assessment: Dict[str, str]  # skill -> level (beginner/intermediate/advanced)
 
+
+def _normalize_text(text: str) -> str:
+    """Lowercase, turn separator punctuation into spaces and collapse whitespace"""
+    return _WHITESPACE_RE.sub(' ', text.lower().translate(_SEPARATORS_TO_SPACE))
+
+
+def _coverage_mask(spans: List[Tuple[int, int]], text_len: int) -> np.ndarray:
+    """Boolean mask over positions 0..text_len covered by any inclusive (lo, hi) span"""
+    delta = np.zeros(text_len + 2, dtype=np.int32)
+    if spans:
+        bounds = np.array(spans)
+        np.add.at(delta, bounds[:, 0], 1)
+        np.add.at(delta, bounds[:, 1] + 1, -1)
+    mask = np.cumsum(delta[:-1]) > 0
+    mask.setflags(write=False)
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Dataclass field names, resolved once per class"""
+    return tuple(field.name for field in fields(cls))
+
+
+def _to_dict(value):
+    """Convert analysis dataclasses to plain containers without asdict()'s deep copies"""
+    if isinstance(value, (SkillMatch, SkillGapAnalysis)):
+        return {name: _to_dict(getattr(value, name)) for name in _field_names(type(value))}
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    return value
+
 class SkillAnalyzer:
     """Advanced skill detection and gap analysis system"""
     
@@ -107,13 +294,41 @@ class SkillAnalyzer:
             'PostgreSQL': ['Postgres', 'PostGres'],
             'Machine Learning': ['ML', 'Machine-Learning'],
             'Deep Learning': ['DL', 'Deep-Learning'],
-            'Natural Language Processing': ['NLP', 'Natural Language Processing'],
+            'Natural Language Processing': ['NLP'],
             'Computer Vision': ['CV', 'Image Processing'],
             'Amazon Web Services': ['AWS'],
             'Google Cloud Platform': ['GCP', 'Google Cloud'],
             'Microsoft Azure': ['Azure']
         }
         
+        # Lowercase synonyms per skill, deduplicated and excluding the skill's own name
+        self._synonyms_clean = {
+            standard_name: tuple(dict.fromkeys(
+                synonym.lower() for synonym in synonyms if synonym.lower() != standard_name.lower()
+            ))
+            for standard_name, synonyms in self.skill_synonyms.items()
+        }
+        
+        # Lowercase synonym/canonical name -> canonical name; first listing wins
+        self._synonym_to_canonical = {}
+        for standard_name, synonyms in self.skill_synonyms.items():
+            for name in [*synonyms, standard_name]:
+                self._synonym_to_canonical.setdefault(name.lower(), standard_name)
+        
+        # Related skills that can stand in for a missing one (lowercase)
+        skill_relationships = {
+            'react': ['angular', 'vue.js', 'javascript', 'typescript'],
+            'angular': ['react', 'vue.js', 'typescript', 'javascript'],
+            'vue.js': ['react', 'angular', 'javascript', 'typescript'],
+            'python': ['java', 'javascript', 'c++', 'go'],
+            'mysql': ['postgresql', 'sqlite', 'oracle', 'sql server'],
+            'mongodb': ['redis', 'cassandra', 'dynamodb'],
+            'aws': ['azure', 'google cloud', 'docker', 'kubernetes'],
+            'docker': ['kubernetes', 'aws', 'azure', 'containerization'],
+            'machine learning': ['deep learning', 'data science', 'ai', 'tensorflow', 'pytorch']
+        }
+        self._alternatives_of = {skill: frozenset(related) for skill, related in skill_relationships.items()}
+        
         # Skill importance weights based on job market demand
         self.skill_importance = {
             'Python': 0.95, 'JavaScript': 0.90, 'React': 0.85, 'AWS': 0.90,
@@ -121,6 +336,38 @@ class SkillAnalyzer:
             'SQL': 0.90, 'Git': 0.95, 'Node.js': 0.80, 'Angular': 0.75,
             'Java': 0.85, 'C++': 0.70, 'MongoDB': 0.70, 'PostgreSQL': 0.75
         }
+        
+        # Ordered (skill, main_category) pairs, deduplicated across subcategories
+        self._skill_entries = list(dict.fromkeys(
+            (skill, main_category)
+            for main_category, subcategories in self.skill_categories.items()
+            for skills in (subcategories.values() if isinstance(subcategories, dict) else [subcategories])
+            for skill in skills
+        ))
+        
+        # Parallel per-skill arrays indexed by skill id (position in _skill_entries)
+        self._category_names = list(dict.fromkeys(category for _, category in self._skill_entries))
+        category_index = {category: idx for idx, category in enumerate(self._category_names)}
+        self._skill_names = np.array([skill for skill, _ in self._skill_entries], dtype=object)
+        self._skill_category_idx = np.array(
+            [category_index[category] for _, category in self._skill_entries], dtype=np.int32
+        )
+        self._n_skills = len(self._skill_entries)
+        self._n_mask_words = -(-self._n_skills // 64)
+        
+        # Lowercase name/synonym -> ids of the skills it counts as
+        self._skill_ids_by_alias = defaultdict(list)
+        for skill_id, (skill, _) in enumerate(self._skill_entries):
+            for alias in (skill.lower(), *self._synonyms_clean.get(skill, ())):
+                self._skill_ids_by_alias[alias].append(skill_id)
+        
+        # Single automaton over all skill names and synonyms
+        self._skill_automaton = self._build_skill_automaton()
+        
+        # Memoized scan results keyed by text digest
+        self._confidence_cache = _LRUCache(_SCAN_CACHE_SIZE)
+        self._level_cache = _LRUCache(_LEVEL_CACHE_SIZE)
+        self._context_cache = _LRUCache(_SCAN_CACHE_SIZE)
 
     def _load_skill_database(self) -> Dict[str, Dict]:
         """Load or create comprehensive skill database"""
@@ -168,133 +415,265 @@ class SkillAnalyzer:
         skill = skill.strip()
         
         # Check synonyms
-        for standard_name, synonyms in self.skill_synonyms.items():
-            if skill.lower() in [s.lower() for s in synonyms]:
-                return standard_name
+        standard_name = self._synonym_to_canonical.get(skill.lower())
+        if standard_name:
+            return standard_name
         
         # Basic normalization
-        skill = re.sub(r'[^\w\s.-]', '', skill)
+        skill = skill.translate(_SKILL_NAME_STRIP)
         skill = ' '.join(word.capitalize() for word in skill.split())
         
         return skill
 
-    def extract_skills_from_text(self, text: str) -> Dict[str, List[Tuple[str, float]]]:
-        """Extract skills from text with confidence scores"""
-        
-        text_lower = text.lower()
-        found_skills = defaultdict(list)
-        
-        # Extract skills by category
-        for main_category, subcategories in self.skill_categories.items():
-            if isinstance(subcategories, dict):
-                for sub_category, skills in subcategories.items():
-                    for skill in skills:
-                        confidence = self._calculate_skill_confidence(skill, text_lower)
-                        if confidence > 0.3:  # Threshold for skill detection
-                            found_skills[main_category].append((skill, confidence))
-            else:
-                for skill in subcategories:
-                    confidence = self._calculate_skill_confidence(skill, text_lower)
-                    if confidence > 0.3:
-                        found_skills[main_category].append((skill, confidence))
-        
-        # Sort by confidence
-        for category in found_skills:
-            found_skills[category].sort(key=lambda x: x[1], reverse=True)
-        
-        return dict(found_skills)
+    def _build_skill_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton mapping every skill/synonym to its skills"""
+        
+        # term -> {skill_id: confidence}
+        term_payloads = defaultdict(dict)
+        for skill_id, (skill, _) in enumerate(self._skill_entries):
+            term_payloads[_normalize_text(skill).strip()][skill_id] = _EXACT_MATCH_CONFIDENCE
+            for synonym in self._synonyms_clean.get(skill, ()):
+                term_payloads[_normalize_text(synonym).strip()].setdefault(skill_id, _SYNONYM_MATCH_CONFIDENCE)
+        
+        automaton = ahocorasick.Automaton()
+        for term, targets in term_payloads.items():
+            automaton.add_word(term, (len(term), tuple(targets.items())))
+        automaton.make_automaton()
+        
+        return automaton
 
-    def _calculate_skill_confidence(self, skill: str, text: str) -> float:
-        """Calculate confidence score for skill detection"""
-        
-        skill_lower = skill.lower()
-        confidence = 0.0
-        
-        # Exact match (highest confidence)
-        if skill_lower in text:
-            confidence = 0.9
+    def _skill_confidences(self, text: str) -> np.ndarray:
+        """Return detection confidence per skill id (0 where the skill is absent)"""
+        return self._scan_skill_confidences(text)[0]
+
+    def _scan_skill_confidences(self, *texts: str) -> np.ndarray:
+        """Return one confidence row per text, scanning only texts not seen recently"""
         
-        # Check synonyms
-        synonyms = self.skill_synonyms.get(skill, [])
-        for synonym in synonyms:
-            if synonym.lower() in text:
-                confidence = max(confidence, 0.8)
-        
-        # Partial match with word boundaries
-        skill_words = skill_lower.split()
-        if len(skill_words) > 1:
-            # Multi-word skill
-            pattern = r'\b' + r'\s+'.join(skill_words) + r'\b'
-            if re.search(pattern, text):
-                confidence = max(confidence, 0.85)
-        else:
-            # Single word skill with word boundaries
-            pattern = r'\b' + skill_lower + r'\b'
-            if re.search(pattern, text):
-                confidence = max(confidence, 0.7)
-        
-        # Context-based confidence adjustment
-        context_patterns = {
-            'experience': [r'experience\s+with\s+' + skill_lower, r'worked\s+with\s+' + skill_lower],
-            'proficient': [r'proficient\s+in\s+' + skill_lower, r'expert\s+in\s+' + skill_lower],
-            'years': [r'\d+\s+years?\s+of\s+' + skill_lower, skill_lower + r'\s+for\s+\d+\s+years?']
-        }
+        digests = [_text_digest(text) for text in texts]
+        rows = [self._confidence_cache.get(digest) for digest in digests]
+        misses = [idx for idx, row in enumerate(rows) if row is None]
         
-        for context_type, patterns in context_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text):
-                    confidence = min(1.0, confidence + 0.1)
+        if misses:
+            scanned = self._scan_texts([texts[idx] for idx in misses])
+            for idx, row in zip(misses, scanned):
+                row.setflags(write=False)
+                self._confidence_cache.put(digests[idx], row)
+                rows[idx] = row
         
-        return confidence
+        return np.stack(rows)
 
-    def extract_job_requirements(self, job_description: str) -> Dict[str, List[Tuple[str, float]]]:
-        """Extract required skills from job description with importance scores"""
+    def _scan_texts(self, texts: List[str]) -> np.ndarray:
+        """Scan several texts in one automaton pass; returns one confidence row per text"""
+        
+        # Normalize separators and whitespace so "machine-learning" and multi-word skills
+        # split across lines match, then join the texts with a separator no skill or
+        # context cue can span
+        segments = [_normalize_text(text) for text in texts]
+        segment_starts = []
+        offset = 0
+        for segment in segments:
+            segment_starts.append(offset)
+            offset += len(segment) + len(_TEXT_SEPARATOR)
+        text_lower = _TEXT_SEPARATOR.join(segments)
+        text_len = len(text_lower)
+        
+        # Positions where context cues end (prefix cues) or start (suffix cue); one bit per cue type
+        prefix_cue_bits = defaultdict(int)
+        for match in _CONTEXT_PREFIX_RE.finditer(text_lower):
+            prefix_cue_bits[match.end()] |= 1 << match.lastindex
+        suffix_cue_starts = {match.start() for match in _CONTEXT_SUFFIX_RE.finditer(text_lower)}
+        
+        # One pass over the text finds every skill/synonym occurrence; hits are
+        # buffered as flat arrays and aggregated below
+        hit_starts, hit_ids, hit_confidences, hit_cue_bits = [], [], [], []
+        for end_index, (term_len, targets) in self._skill_automaton.iter(text_lower):
+            start = end_index - term_len + 1
+            end = end_index + 1
+            
+            # Enforce word boundaries with cheap character checks
+            if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] == '_'):
+                continue
+            if end < text_len and (text_lower[end].isalnum() or text_lower[end] == '_'):
+                continue
+            
+            cue_bits = prefix_cue_bits.get(start, 0)
+            if end in suffix_cue_starts:
+                cue_bits |= 1 << _CONTEXT_SUFFIX_TYPE
+            
+            for skill_id, confidence in targets:
+                hit_starts.append(start)
+                hit_ids.append(skill_id)
+                hit_confidences.append(confidence)
+                hit_cue_bits.append(cue_bits)
+        
+        confidences = np.zeros((len(texts), self._n_skills))
+        if not hit_ids:
+            return confidences
+        
+        # Best confidence and union of context cues per (text, skill)
+        cells = (np.searchsorted(segment_starts, hit_starts, side='right') - 1, np.array(hit_ids))
+        cue_bits = np.zeros_like(confidences, dtype=np.uint8)
+        np.maximum.at(confidences, cells, np.array(hit_confidences))
+        np.bitwise_or.at(cue_bits, cells, np.array(hit_cue_bits, dtype=np.uint8))
+        
+        # Apply context bonuses: one per distinct cue type
+        cue_counts = np.unpackbits(cue_bits[..., np.newaxis], axis=-1).sum(axis=-1)
+        return np.minimum(confidences + _CONTEXT_BONUS * cue_counts, 1.0)
+
+    def _ranked_skill_ids(self, confidences: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+        """Ids of detected skills, grouped by category and ordered by confidence"""
+        skill_ids = np.flatnonzero(confidences)
+        order = np.lexsort((skill_ids, -confidences[skill_ids], self._skill_category_idx[skill_ids]))
+        skill_ids = skill_ids[order]
+        
+        if top_k is not None:
+            # Rank within category = position minus the category's first position
+            categories = self._skill_category_idx[skill_ids]
+            _, first_positions, group_index = np.unique(categories, return_index=True, return_inverse=True)
+            rank = np.arange(len(skill_ids)) - first_positions[group_index]
+            skill_ids = skill_ids[rank < top_k]
+        
+        return skill_ids
+
+    def _group_by_category(self, skill_ids: np.ndarray, scores: np.ndarray) -> Dict[str, List[Tuple[str, float]]]:
+        """Convert ordered skill ids and per-id scores to the category -> [(skill, score)] form"""
+        grouped = defaultdict(list)
+        for skill_id in skill_ids.tolist():
+            category = self._category_names[self._skill_category_idx[skill_id]]
+            grouped[category].append((self._skill_names[skill_id], float(scores[skill_id])))
+        return dict(grouped)
+
+    def _job_requirement_arrays(self, job_description: str,
+                                confidences: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ordered required skill ids and importance per skill id"""
         
         # Preprocess job description
         job_desc_lower = job_description.lower()
         
         # Extract skills
-        required_skills = self.extract_skills_from_text(job_description)
+        if confidences is None:
+            confidences = self._skill_confidences(job_description)
+        skill_ids = self._ranked_skill_ids(confidences)
         
         # Adjust importance based on context in job description
-        for category, skills in required_skills.items():
-            adjusted_skills = []
-            for skill, confidence in skills:
-                importance = self._calculate_skill_importance(skill, job_desc_lower)
-                adjusted_skills.append((skill, importance))
-            required_skills[category] = adjusted_skills
+        contexts = self._scan_contexts(job_desc_lower)
+        importances = np.zeros(self._n_skills)
+        for skill_id in skill_ids.tolist():
+            importances[skill_id] = self._calculate_skill_importance(
+                self._skill_names[skill_id], job_desc_lower, contexts
+            )
         
-        return required_skills
+        return skill_ids, importances
+
+    def _scan_both(self, resume_text: str, job_description: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Scan resume and job description in one pass; returns resume confidences and job requirement arrays"""
+        resume_confidences, job_confidences = self._scan_skill_confidences(resume_text, job_description)
+        job_skill_ids, job_importances = self._job_requirement_arrays(job_description, job_confidences)
+        return resume_confidences, job_skill_ids, job_importances
+
+    def _presence_mask(self, skills: Iterable[str]) -> np.ndarray:
+        """Boolean mask over skill ids for skills named (or aliased) in `skills`"""
+        present = np.zeros(self._n_skills, dtype=bool)
+        for skill in skills:
+            skill_ids = self._skill_ids_by_alias.get(skill.lower())
+            if skill_ids:
+                present[skill_ids] = True
+        return present
+
+    def encode_skills(self, skills: Iterable[str]) -> np.ndarray:
+        """Encode skill names/synonyms as a packed uint64 bitmask over skill ids"""
+        present = np.zeros(self._n_mask_words * 64, dtype=bool)
+        present[:self._n_skills] = self._presence_mask(skills)
+        return np.packbits(present, bitorder='little').view(np.uint64)
+
+    @staticmethod
+    def skill_overlap_counts(skill_masks: np.ndarray, target_mask: np.ndarray) -> np.ndarray:
+        """Number of shared skills between each row of `skill_masks` and `target_mask`"""
+        shared = np.bitwise_and(skill_masks, target_mask)
+        return np.unpackbits(shared.view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+    def extract_skills_from_text(self, text: str,
+                                 top_k: Optional[int] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """Extract skills from text with confidence scores, optionally keeping the top_k per category"""
+        confidences = self._skill_confidences(text)
+        return self._group_by_category(self._ranked_skill_ids(confidences, top_k), confidences)
+
+    def extract_job_requirements(self, job_description: str) -> Dict[str, List[Tuple[str, float]]]:
+        """Extract required skills from job description with importance scores"""
+        skill_ids, importances = self._job_requirement_arrays(job_description)
+        return self._group_by_category(skill_ids, importances)
 
-    def _calculate_skill_importance(self, skill: str, job_description: str) -> float:
+    def _scan_contexts(self, job_desc_lower: str) -> Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """Find all importance cues in one pass; per kind, masks of boosted skill start (and end) positions"""
+        digest = _text_digest(job_desc_lower)
+        contexts = self._context_cache.get(digest)
+        if contexts is not None:
+            return contexts
+        
+        text_len = len(job_desc_lower)
+        
+        def line_end(pos: int) -> int:
+            newline = job_desc_lower.find('\n', pos)
+            return text_len if newline == -1 else newline
+        
+        start_spans = defaultdict(list)
+        end_spans = []
+        for match in _IMPORTANCE_CUE_RE.finditer(job_desc_lower):
+            group = match.lastindex
+            kind = _IMPORTANCE_CUE_KINDS[group]
+            
+            # Trailing whitespace/colon may span lines; the skill must follow on the line it ends on
+            if group == _EXPERIENCE_CUE_GROUP:
+                # "3 years python": needs whitespace after the cue
+                if match.end(group) > match.start(group):
+                    start_spans[kind].append((match.start(group) + 1, line_end(match.end(group))))
+                # "python ... 3 years": skill ends on the cue's line, before it
+                cue_start = match.start(group - 1)
+                end_spans.append((job_desc_lower.rfind('\n', 0, cue_start) + 1, cue_start))
+            elif group in _IMPORTANCE_TAIL_GROUPS:
+                start_spans[kind].append((match.start(group), line_end(match.end(group))))
+            else:
+                start_spans[kind].append((match.end(group), line_end(match.end(group))))
+        
+        contexts = {
+            kind: (
+                _coverage_mask(start_spans.get(kind, []), text_len),
+                _coverage_mask(end_spans, text_len) if kind == 'experience' else None
+            )
+            for kind in _IMPORTANCE_MULTIPLIERS
+        }
+        self._context_cache.put(digest, contexts)
+        
+        return contexts
+
+    def _calculate_skill_importance(self, skill: str, job_description: str,
+                                    contexts: Optional[Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]]] = None) -> float:
         """Calculate skill importance based on job description context"""
         
-        skill_lower = skill.lower()
         base_importance = self.skill_importance.get(skill, 0.5)
         
-        # Context-based importance adjustment
-        importance_indicators = {
-            'required': [r'required?\s*:?\s*.*' + skill_lower, r'must\s+have.*' + skill_lower],
-            'preferred': [r'preferred?\s*:?\s*.*' + skill_lower, r'nice\s+to\s+have.*' + skill_lower],
-            'essential': [r'essential.*' + skill_lower, r'critical.*' + skill_lower],
-            'experience': [r'\d+\+?\s+years?\s+.*' + skill_lower, skill_lower + r'.*\d+\+?\s+years?']
-        }
+        if contexts is None:
+            contexts = self._scan_contexts(job_description)
         
-        importance_multipliers = {
-            'required': 1.2,
-            'essential': 1.3,
-            'experience': 1.1,
-            'preferred': 0.9
-        }
+        # Every (possibly overlapping) mention of the skill
+        skill_lower = skill.lower()
+        mention_starts = []
+        position = job_description.find(skill_lower)
+        while position != -1:
+            mention_starts.append(position)
+            position = job_description.find(skill_lower, position + 1)
+        if not mention_starts:
+            return min(1.0, base_importance)
+        mention_starts = np.array(mention_starts)
+        mention_ends = mention_starts + len(skill_lower)
         
+        # Context-based importance adjustment
         final_importance = base_importance
         
-        for indicator_type, patterns in importance_indicators.items():
-            for pattern in patterns:
-                if re.search(pattern, job_description):
-                    multiplier = importance_multipliers.get(indicator_type, 1.0)
-                    final_importance *= multiplier
-                    break
+        for kind, multiplier in _IMPORTANCE_MULTIPLIERS.items():
+            start_mask, end_mask = contexts[kind]
+            if start_mask[mention_starts].any() or (end_mask is not None and end_mask[mention_ends].any()):
+                final_importance *= multiplier
         
         return min(1.0, final_importance)
 
@@ -304,66 +683,58 @@ class SkillAnalyzer:
                           resume_skills: Optional[List[str]] = None) -> SkillGapAnalysis:
         """Perform comprehensive skill gap analysis"""
         
-        # Extract skills from resume
-        resume_skill_matches = self.extract_skills_from_text(resume_text)
-        
-        # Extract requirements from job description
-        job_requirements = self.extract_job_requirements(job_description)
+        # Extract skills from resume and requirements from job description
+        resume_confidences, job_skill_ids, job_importances = self._scan_both(resume_text, job_description)
         
-        # Flatten skills for easier comparison
-        resume_skills_flat = set()
-        for category, skills in resume_skill_matches.items():
-            for skill, _ in skills:
-                resume_skills_flat.add(skill.lower())
-        
-        # Add manually provided skills
+        # Lowercase resume skills, including manually provided ones
+        resume_skills_flat = {skill.lower() for skill in self._skill_names[resume_confidences > 0]}
         if resume_skills:
-            for skill in resume_skills:
-                resume_skills_flat.add(skill.lower())
+            resume_skills_flat.update(skill.lower() for skill in resume_skills)
+        resume_skills_flat = frozenset(resume_skills_flat)
+        
+        # A skill is present if its name or any synonym appears among the resume skills
+        resume_present = self._presence_mask(resume_skills_flat)
         
         matched_skills = []
         missing_skills = []
         skill_categories = defaultdict(list)
         
         # Analyze each required skill
-        for category, required_skills in job_requirements.items():
-            for skill, importance in required_skills:
-                skill_lower = skill.lower()
-                
-                # Check if skill is present in resume
-                is_present = (skill_lower in resume_skills_flat or 
-                            any(synonym.lower() in resume_skills_flat 
-                                for synonym in self.skill_synonyms.get(skill, [])))
-                
-                # Find alternatives/related skills
-                alternatives = self._find_alternative_skills(skill, resume_skills_flat)
-                
-                skill_match = SkillMatch(
-                    skill=skill,
-                    category=category,
-                    confidence=importance,
-                    found_in_resume=is_present,
-                    importance=importance,
-                    alternatives=alternatives
-                )
-                
-                if is_present:
-                    matched_skills.append(skill_match)
-                    skill_categories['matched'].append(skill)
-                else:
-                    missing_skills.append(skill_match)
-                    skill_categories['missing'].append(skill)
-        
-        # Calculate overall match score
-        total_importance = sum(skill.importance for skill in matched_skills + missing_skills)
-        matched_importance = sum(skill.importance for skill in matched_skills)
-        overall_match_score = matched_importance / total_importance if total_importance > 0 else 0
-        
-        # Identify critical gaps (high importance missing skills)
-        critical_gaps = [
-            skill.skill for skill in missing_skills 
-            if skill.importance > 0.7
-        ]
+        required_present = resume_present[job_skill_ids]
+        for skill_id, is_present in zip(job_skill_ids.tolist(), required_present.tolist()):
+            skill = self._skill_names[skill_id]
+            importance = float(job_importances[skill_id])
+            
+            # Find alternatives/related skills
+            alternatives = self._find_alternative_skills(skill, resume_skills_flat)
+            
+            skill_match = SkillMatch(
+                skill=skill,
+                category=self._category_names[self._skill_category_idx[skill_id]],
+                confidence=importance,
+                found_in_resume=is_present,
+                importance=importance,
+                alternatives=alternatives
+            )
+            
+            if is_present:
+                matched_skills.append(skill_match)
+                skill_categories['matched'].append(skill)
+            else:
+                missing_skills.append(skill_match)
+                skill_categories['missing'].append(skill)
+        
+        # Calculate overall match score (importance is zero for skills the job doesn't mention)
+        total_importance = job_importances.sum()
+        overall_match_score = (
+            float(np.dot(resume_present, job_importances) / total_importance) if total_importance > 0 else 0
+        )
+        
+        # Identify critical gaps (high importance missing skills), in requirement order
+        missing_ids = job_skill_ids[~required_present]
+        critical_gaps = self._skill_names[
+            missing_ids[job_importances[missing_ids] > _CRITICAL_GAP_IMPORTANCE]
+        ].tolist()
         
         # Generate recommendations
         recommendations = self._generate_skill_recommendations(
@@ -386,29 +757,7 @@ class SkillAnalyzer:
     def _find_alternative_skills(self, target_skill: str, resume_skills: Set[str]) -> List[str]:
         """Find alternative or related skills in resume"""
         
-        alternatives = []
-        target_lower = target_skill.lower()
-        
-        # Define skill relationships
-        skill_relationships = {
-            'react': ['angular', 'vue.js', 'javascript', 'typescript'],
-            'angular': ['react', 'vue.js', 'typescript', 'javascript'],
-            'vue.js': ['react', 'angular', 'javascript', 'typescript'],
-            'python': ['java', 'javascript', 'c++', 'go'],
-            'mysql': ['postgresql', 'sqlite', 'oracle', 'sql server'],
-            'mongodb': ['redis', 'cassandra', 'dynamodb'],
-            'aws': ['azure', 'google cloud', 'docker', 'kubernetes'],
-            'docker': ['kubernetes', 'aws', 'azure', 'containerization'],
-            'machine learning': ['deep learning', 'data science', 'ai', 'tensorflow', 'pytorch']
-        }
-        
-        related_skills = skill_relationships.get(target_lower, [])
-        
-        for skill in resume_skills:
-            if skill in related_skills:
-                alternatives.append(skill)
-        
-        return alternatives
+        return list(self._alternatives_of.get(target_skill.lower(), frozenset()) & resume_skills)
 
     def _generate_skill_recommendations(self, 
                                      missing_skills: List[SkillMatch],
@@ -458,6 +807,15 @@ class SkillAnalyzer:
         
         return recommendations
 
+    @staticmethod
+    def _scan_level_cues(resume_lower: str) -> Tuple[Dict[int, int], List[int]]:
+        """Find all proficiency cues in one pass; returns cue end -> level bits and suffix cue starts"""
+        cue_levels = defaultdict(int)
+        for match in _LEVEL_CUE_RE.finditer(resume_lower):
+            cue_levels[match.end(match.lastindex)] |= 1 << (len(_LEVEL_PREFIX_CUES) - match.lastindex)
+        suffix_starts = [match.start() for match in _LEVEL_SUFFIX_RE.finditer(resume_lower)]
+        return dict(cue_levels), suffix_starts
+
     def _assess_skill_levels(self, 
                            resume_text: str, 
                            matched_skills: List[SkillMatch]) -> Dict[str, str]:
@@ -465,92 +823,54 @@ class SkillAnalyzer:
         
         skill_levels = {}
         resume_lower = resume_text.lower()
+        resume_digest = _text_digest(resume_text)
+        level_cues = None
         
         for skill_match in matched_skills:
             skill = skill_match.skill
-            skill_lower = skill.lower()
+            cached_level = self._level_cache.get((resume_digest, skill))
+            if cached_level is not None:
+                skill_levels[skill] = cached_level
+                continue
             
-            # Look for experience indicators
-            level_indicators = {
-                'advanced': [
-                    f'expert in {skill_lower}',
-                    f'senior {skill_lower}',
-                    f'lead {skill_lower}',
-                    f'{skill_lower} architect',
-                    f'mastery of {skill_lower}',
-                    f'\\d+\\+? years of {skill_lower}'
-                ],
-                'intermediate': [
-                    f'proficient in {skill_lower}',
-                    f'experienced with {skill_lower}',
-                    f'solid understanding of {skill_lower}',
-                    f'worked with {skill_lower}',
-                    f'familiar with {skill_lower}'
-                ],
-                'beginner': [
-                    f'basic {skill_lower}',
-                    f'introduction to {skill_lower}',
-                    f'learning {skill_lower}',
-                    f'exposure to {skill_lower}'
-                ]
-            }
+            # Scan the resume for cues once, on the first uncached skill
+            if level_cues is None:
+                level_cues = self._scan_level_cues(resume_lower)
+            cue_levels, suffix_starts = level_cues
             
-            detected_level = 'intermediate'  # Default
+            # Levels whose cues sit directly next to a mention of the skill
+            skill_lower = skill.lower()
+            level_mask = 0
+            for cue_end, level_bits in cue_levels.items():
+                if resume_lower.startswith(skill_lower, cue_end):
+                    level_mask |= level_bits
+            if any(start >= len(skill_lower) and resume_lower.startswith(skill_lower, start - len(skill_lower))
+                   for start in suffix_starts):
+                level_mask |= _LEVEL_SUFFIX_BIT
             
-            for level, patterns in level_indicators.items():
-                for pattern in patterns:
-                    if re.search(pattern, resume_lower):
-                        detected_level = level
-                        break
-                if detected_level == level:
-                    break
+            detected_level = _LEVEL_BY_MASK[level_mask]
             
             skill_levels[skill] = detected_level
+            self._level_cache.put((resume_digest, skill), detected_level)
         
         return skill_levels
 
     def get_skill_learning_path(self, missing_skill: str) -> Dict[str, List[str]]:
         """Generate learning path for a missing skill"""
         
-        learning_paths = {
-            'React': {
-                'prerequisites': ['JavaScript', 'HTML', 'CSS'],
-                'core_concepts': ['Components', 'JSX', 'State Management', 'Props', 'Hooks'],
-                'advanced_topics': ['Redux', 'Context API', 'Testing', 'Performance Optimization'],
-                'projects': ['Todo App', 'Weather App', 'E-commerce Site']
-            },
-            'Python': {
-                'prerequisites': ['Programming Basics'],
-                'core_concepts': ['Syntax', 'Data Types', 'Functions', 'OOP', 'Modules'],
-                'advanced_topics': ['Web Frameworks', 'Data Science', 'Machine Learning'],
-                'projects': ['Calculator', 'Web Scraper', 'API Development']
-            },
-            'AWS': {
-                'prerequisites': ['Cloud Computing Basics', 'Linux'],
-                'core_concepts': ['EC2', 'S3', 'IAM', 'VPC', 'Lambda'],
-                'advanced_topics': ['EKS', 'CloudFormation', 'DevOps', 'Security'],
-                'projects': ['Static Website Hosting', 'Serverless API', 'CI/CD Pipeline']
-            },
-            'Machine Learning': {
-                'prerequisites': ['Python', 'Statistics', 'Linear Algebra'],
-                'core_concepts': ['Supervised Learning', 'Unsupervised Learning', 'Model Evaluation'],
-                'advanced_topics': ['Deep Learning', 'NLP', 'Computer Vision'],
-                'projects': ['Iris Classification', 'House Price Prediction', 'Image Recognition']
-            }
-        }
-        
-        return learning_paths.get(missing_skill, {
-            'prerequisites': ['Research the skill requirements'],
-            'core_concepts': ['Start with fundamentals'],
-            'advanced_topics': ['Explore advanced applications'],
-            'projects': ['Build practical projects']
-        })
+        learning_path = _LEARNING_PATHS.get(missing_skill, _DEFAULT_LEARNING_PATH)
+        return {stage: list(items) for stage, items in learning_path.items()}
 
     def export_analysis(self, analysis: SkillGapAnalysis, format: str = 'json') -> str:
         """Export skill gap analysis in specified format"""
         
         if format == 'json':
-            return json.dumps(asdict(analysis), indent=2, default=str)
+            if orjson is not None:
+                # Serializes the dataclass tree directly, without building an intermediate dict
+                return orjson.dumps(
+                    analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+                ).decode()
+            return json.dumps(_to_dict(analysis), indent=2, default=str)
         elif format == 'summary':
             summary = f"""
 SKILL GAP ANALYSIS SUMMARY
@@ -573,3 +893,15 @@ TOP RECOMMENDATIONS:
             return summary.strip()
         
         return str(analysis)
+
+
+# Shared analyzer so the skill database and automaton are built once per process
+_default_analyzer: Optional[SkillAnalyzer] = None
+
+
+def get_default_analyzer() -> SkillAnalyzer:
+    """Return the process-wide SkillAnalyzer, building it on first use"""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = SkillAnalyzer()
+    return _default_analyzer
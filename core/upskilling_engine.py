@@ -3,20 +3,144 @@ Upskilling Simulation and Course Recommendation Engine
 Estimates impact of acquiring skills and suggests relevant courses
 """
 
+import re
 import json
+import heapq
 import logging
-import requests
+import threading
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
+from functools import lru_cache, cached_property
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# First dollar amount in a course price string
+_PRICE_RE = re.compile(r'\$(\d+(?:\.\d+)?)')
+
+# Bound on memoized (skill, probability, importance) simulations per engine
+_SIMULATION_CACHE_SIZE = 512
+
+# Skill acquisition difficulty and time estimates
+_SKILL_METADATA = {
+    'Python': {'difficulty': 'Beginner', 'time_weeks': 8, 'impact_multiplier': 1.3},
+    'JavaScript': {'difficulty': 'Beginner', 'time_weeks': 6, 'impact_multiplier': 1.25},
+    'React': {'difficulty': 'Intermediate', 'time_weeks': 10, 'impact_multiplier': 1.4},
+    'Angular': {'difficulty': 'Intermediate', 'time_weeks': 12, 'impact_multiplier': 1.35},
+    'Node.js': {'difficulty': 'Intermediate', 'time_weeks': 8, 'impact_multiplier': 1.2},
+    'AWS': {'difficulty': 'Intermediate', 'time_weeks': 16, 'impact_multiplier': 1.5},
+    'Docker': {'difficulty': 'Intermediate', 'time_weeks': 6, 'impact_multiplier': 1.3},
+    'Kubernetes': {'difficulty': 'Advanced', 'time_weeks': 20, 'impact_multiplier': 1.6},
+    'Machine Learning': {'difficulty': 'Advanced', 'time_weeks': 24, 'impact_multiplier': 1.7},
+    'Deep Learning': {'difficulty': 'Advanced', 'time_weeks': 28, 'impact_multiplier': 1.8},
+    'SQL': {'difficulty': 'Beginner', 'time_weeks': 4, 'impact_multiplier': 1.2},
+    'MongoDB': {'difficulty': 'Intermediate', 'time_weeks': 6, 'impact_multiplier': 1.15},
+    'PostgreSQL': {'difficulty': 'Intermediate', 'time_weeks': 8, 'impact_multiplier': 1.25},
+    'Git': {'difficulty': 'Beginner', 'time_weeks': 2, 'impact_multiplier': 1.1},
+    'Jenkins': {'difficulty': 'Intermediate', 'time_weeks': 10, 'impact_multiplier': 1.3},
+    'Terraform': {'difficulty': 'Advanced', 'time_weeks': 14, 'impact_multiplier': 1.4}
+}
+
+# Skill relationships and prerequisites
+_SKILL_PREREQS = {
+    'React': ['JavaScript', 'HTML', 'CSS'],
+    'Angular': ['JavaScript', 'TypeScript', 'HTML', 'CSS'],
+    'Node.js': ['JavaScript'],
+    'Django': ['Python'],
+    'Flask': ['Python'],
+    'Spring': ['Java'],
+    'Kubernetes': ['Docker', 'Linux'],
+    'Deep Learning': ['Machine Learning', 'Python'],
+    'TensorFlow': ['Python', 'Machine Learning'],
+    'PyTorch': ['Python', 'Machine Learning']
+}
+
+# Market demand and salary impact data
+_MARKET_DATA = {
+    'Python': {'demand_score': 0.95, 'salary_impact': 15000},
+    'JavaScript': {'demand_score': 0.90, 'salary_impact': 12000},
+    'React': {'demand_score': 0.85, 'salary_impact': 18000},
+    'AWS': {'demand_score': 0.90, 'salary_impact': 25000},
+    'Machine Learning': {'demand_score': 0.85, 'salary_impact': 30000},
+    'Docker': {'demand_score': 0.80, 'salary_impact': 15000},
+    'Kubernetes': {'demand_score': 0.75, 'salary_impact': 20000},
+    'Angular': {'demand_score': 0.75, 'salary_impact': 16000},
+    'Node.js': {'demand_score': 0.80, 'salary_impact': 14000},
+    'SQL': {'demand_score': 0.90, 'salary_impact': 10000}
+}
+
+# Curated learning paths for common skills
+_LEARNING_PATHS = {
+    'Python': (
+        "1. Python Basics & Syntax",
+        "2. Data Structures & Algorithms",
+        "3. Object-Oriented Programming",
+        "4. Libraries & Frameworks",
+        "5. Build Projects & Portfolio"
+    ),
+    'React': (
+        "1. JavaScript ES6+ Fundamentals",
+        "2. React Components & JSX",
+        "3. State Management & Hooks",
+        "4. Routing & Navigation",
+        "5. Build Full-Stack Applications"
+    ),
+    'AWS': (
+        "1. Cloud Computing Fundamentals",
+        "2. Core AWS Services (EC2, S3, IAM)",
+        "3. Networking & Security",
+        "4. DevOps & Automation",
+        "5. Certification & Advanced Services"
+    ),
+    'Machine Learning': (
+        "1. Statistics & Linear Algebra",
+        "2. Python for Data Science",
+        "3. Supervised Learning Algorithms",
+        "4. Unsupervised Learning & Deep Learning",
+        "5. MLOps & Production Deployment"
+    ),
+    'Docker': (
+        "1. Containerization Concepts",
+        "2. Docker Basics & Commands",
+        "3. Dockerfile & Image Creation",
+        "4. Docker Compose & Networking",
+        "5. Production Deployment & Orchestration"
+    )
+}
+
+# Per-skill numeric columns for vectorized simulation; the last row holds the
+# defaults used for skills without metadata/market data
+_DEFAULT_META = {'difficulty': 'Intermediate', 'time_weeks': 12, 'impact_multiplier': 1.2}
+_DEFAULT_MARKET = {'demand_score': 0.7, 'salary_impact': 10000}
+_SKILL_ROW = {skill: row for row, skill in enumerate(dict.fromkeys([*_SKILL_METADATA, *_MARKET_DATA]))}
+_DEFAULT_ROW = len(_SKILL_ROW)
+_IMPACT_MULTIPLIER = np.array(
+    [_SKILL_METADATA.get(skill, _DEFAULT_META)['impact_multiplier'] for skill in _SKILL_ROW]
+    + [_DEFAULT_META['impact_multiplier']], dtype=float)
+_TIME_WEEKS = np.array(
+    [_SKILL_METADATA.get(skill, _DEFAULT_META)['time_weeks'] for skill in _SKILL_ROW]
+    + [_DEFAULT_META['time_weeks']], dtype=float)
+_DEMAND_SCORE = np.array(
+    [_MARKET_DATA.get(skill, _DEFAULT_MARKET)['demand_score'] for skill in _SKILL_ROW]
+    + [_DEFAULT_MARKET['demand_score']], dtype=float)
+_SALARY_IMPACT = np.array(
+    [_MARKET_DATA.get(skill, _DEFAULT_MARKET)['salary_impact'] for skill in _SKILL_ROW]
+    + [_DEFAULT_MARKET['salary_impact']], dtype=float)
+# (time_weeks, difficulty) by row, for the non-numeric simulation fields
+_SKILL_PROFILE = tuple(
+    (meta['time_weeks'], meta['difficulty'])
+    for meta in [_SKILL_METADATA.get(skill, _DEFAULT_META) for skill in _SKILL_ROW] + [_DEFAULT_META]
+)
+
+@dataclass(slots=True)
 class CourseRecommendation:
     """Represents a course recommendation"""
     title: str
@@ -30,7 +154,7 @@ class CourseRecommendation:
     description: str
     relevance_score: float
 
-@dataclass
+@dataclass(slots=True)
 class SkillImpactSimulation:
     """Simulation results for acquiring a skill"""
     skill: str
@@ -42,8 +166,9 @@ class SkillImpactSimulation:
     recommended_courses: List[CourseRecommendation]
     learning_path: List[str]
     roi_score: float  # Return on Investment score
+    weeks: int = 0  # Learning time behind time_to_acquire
 
-@dataclass
+@dataclass(slots=True)
 class UpskillingPlan:
     """Complete upskilling plan with prioritized recommendations"""
     skill_simulations: List[SkillImpactSimulation]
@@ -53,67 +178,112 @@ class UpskillingPlan:
     quick_wins: List[str]  # Skills that can be acquired quickly with high impact
     long_term_goals: List[str]  # Skills requiring significant time investment
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Dataclass field names, resolved once per class"""
+    return tuple(field.name for field in fields(cls))
+
+def _to_dict(value):
+    """Convert plan dataclasses to plain containers without asdict()'s deep copies"""
+    if isinstance(value, (CourseRecommendation, SkillImpactSimulation, UpskillingPlan)):
+        return {name: _to_dict(getattr(value, name)) for name in _field_names(type(value))}
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+    return value
+
+def _format_time_estimate(weeks: int) -> str:
+    """Format time estimate in human-readable format"""
+    if weeks <= 4:
+        return f"{weeks} weeks (1 month)"
+    # round() keeps the existing half-to-even month counts (10 weeks -> 2 months)
+    return f"{weeks} weeks ({round(weeks / 4)} months)"
+
+def _parse_price(price_str: str) -> float:
+    """Estimated cost of a course from its price string (simplified parsing)"""
+    price_lower = price_str.lower()
+    if 'free' in price_lower:
+        return 0.0
+    if '$' in price_str:
+        # Extract first number after $
+        price_match = _PRICE_RE.search(price_str)
+        if price_match:
+            cost = float(price_match.group(1))
+            # If it's monthly, assume 3 months
+            if 'month' in price_lower:
+                cost *= 3
+            return cost
+    return 100.0  # Default estimate
+
+def _simulate_impact(importance: np.ndarray,
+                     impact_multiplier: np.ndarray,
+                     time_weeks: np.ndarray,
+                     demand_score: np.ndarray,
+                     salary_impact: np.ndarray,
+                     current_probability: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Probability increase, projected probability and ROI score for each skill"""
+    
+    # Calculate projected probability increase
+    base_increase = importance * 0.3  # Base 30% increase for important skills
+    multiplier_bonus = (impact_multiplier - 1.0) * 0.5
+    total_increase = base_increase + multiplier_bonus
+    
+    # Apply diminishing returns for already high probabilities
+    if current_probability > 0.7:
+        total_increase = total_increase * 0.7
+    elif current_probability > 0.5:
+        total_increase = total_increase * 0.85
+    
+    projected_probability = np.minimum(0.95, current_probability + total_increase)
+    
+    # ROI factors
+    impact_factor = total_increase * 10  # Convert to 0-10 scale
+    demand_factor = demand_score * 5  # Convert to 0-5 scale
+    time_factor = np.maximum(1, 10 - (time_weeks / 4))  # Penalty for longer learning time
+    salary_factor = np.minimum(5, salary_impact / 5000)  # Salary impact factor
+    
+    # Calculate weighted ROI score
+    roi_score = (
+        impact_factor * 0.3 +
+        demand_factor * 0.25 +
+        time_factor * 0.2 +
+        salary_factor * 0.25
+    )
+    
+    return total_increase, projected_probability, np.minimum(10.0, roi_score)
+
 class UpskillingEngine:
     """Advanced upskilling simulation and course recommendation system"""
     
     def __init__(self):
         """Initialize the upskilling engine"""
         
-        # Course databases (in production, these would be API calls)
-        self.course_databases = {
+        # Memoized scalar simulation fields; course lists are rebuilt per call
+        self._simulation_cache: OrderedDict = OrderedDict()
+        self._simulation_lock = threading.Lock()
+
+    @cached_property
+    def course_databases(self) -> Dict[str, Dict[str, List[CourseRecommendation]]]:
+        """Course databases by provider, built on first access (in production, these would be API calls)"""
+        return {
             'coursera': self._get_coursera_courses(),
             'udemy': self._get_udemy_courses(),
             'edx': self._get_edx_courses(),
             'pluralsight': self._get_pluralsight_courses(),
             'linkedin_learning': self._get_linkedin_courses()
         }
-        
-        # Skill acquisition difficulty and time estimates
-        self.skill_metadata = {
-            'Python': {'difficulty': 'Beginner', 'time_weeks': 8, 'impact_multiplier': 1.3},
-            'JavaScript': {'difficulty': 'Beginner', 'time_weeks': 6, 'impact_multiplier': 1.25},
-            'React': {'difficulty': 'Intermediate', 'time_weeks': 10, 'impact_multiplier': 1.4},
-            'Angular': {'difficulty': 'Intermediate', 'time_weeks': 12, 'impact_multiplier': 1.35},
-            'Node.js': {'difficulty': 'Intermediate', 'time_weeks': 8, 'impact_multiplier': 1.2},
-            'AWS': {'difficulty': 'Intermediate', 'time_weeks': 16, 'impact_multiplier': 1.5},
-            'Docker': {'difficulty': 'Intermediate', 'time_weeks': 6, 'impact_multiplier': 1.3},
-            'Kubernetes': {'difficulty': 'Advanced', 'time_weeks': 20, 'impact_multiplier': 1.6},
-            'Machine Learning': {'difficulty': 'Advanced', 'time_weeks': 24, 'impact_multiplier': 1.7},
-            'Deep Learning': {'difficulty': 'Advanced', 'time_weeks': 28, 'impact_multiplier': 1.8},
-            'SQL': {'difficulty': 'Beginner', 'time_weeks': 4, 'impact_multiplier': 1.2},
-            'MongoDB': {'difficulty': 'Intermediate', 'time_weeks': 6, 'impact_multiplier': 1.15},
-            'PostgreSQL': {'difficulty': 'Intermediate', 'time_weeks': 8, 'impact_multiplier': 1.25},
-            'Git': {'difficulty': 'Beginner', 'time_weeks': 2, 'impact_multiplier': 1.1},
-            'Jenkins': {'difficulty': 'Intermediate', 'time_weeks': 10, 'impact_multiplier': 1.3},
-            'Terraform': {'difficulty': 'Advanced', 'time_weeks': 14, 'impact_multiplier': 1.4}
-        }
-        
-        # Skill relationships and prerequisites
-        self.skill_prerequisites = {
-            'React': ['JavaScript', 'HTML', 'CSS'],
-            'Angular': ['JavaScript', 'TypeScript', 'HTML', 'CSS'],
-            'Node.js': ['JavaScript'],
-            'Django': ['Python'],
-            'Flask': ['Python'],
-            'Spring': ['Java'],
-            'Kubernetes': ['Docker', 'Linux'],
-            'Deep Learning': ['Machine Learning', 'Python'],
-            'TensorFlow': ['Python', 'Machine Learning'],
-            'PyTorch': ['Python', 'Machine Learning']
-        }
-        
-        # Market demand and salary impact data
-        self.market_data = {
-            'Python': {'demand_score': 0.95, 'salary_impact': 15000},
-            'JavaScript': {'demand_score': 0.90, 'salary_impact': 12000},
-            'React': {'demand_score': 0.85, 'salary_impact': 18000},
-            'AWS': {'demand_score': 0.90, 'salary_impact': 25000},
-            'Machine Learning': {'demand_score': 0.85, 'salary_impact': 30000},
-            'Docker': {'demand_score': 0.80, 'salary_impact': 15000},
-            'Kubernetes': {'demand_score': 0.75, 'salary_impact': 20000},
-            'Angular': {'demand_score': 0.75, 'salary_impact': 16000},
-            'Node.js': {'demand_score': 0.80, 'salary_impact': 14000},
-            'SQL': {'demand_score': 0.90, 'salary_impact': 10000}
+
+    @cached_property
+    def _skill_index(self) -> Dict[str, List[CourseRecommendation]]:
+        """Flat skill -> top courses index across all providers, ranked once"""
+        skill_index = defaultdict(list)
+        for courses_db in self.course_databases.values():
+            for skill, courses in courses_db.items():
+                skill_index[skill].extend(courses)
+        return {
+            skill: sorted(courses, key=lambda x: x.relevance_score, reverse=True)[:3]
+            for skill, courses in skill_index.items()
         }
 
     def _get_coursera_courses(self) -> Dict[str, List[CourseRecommendation]]:
@@ -259,170 +429,107 @@ class UpskillingEngine:
                             skill_importance: float = 0.8) -> SkillImpactSimulation:
         """Simulate the impact of acquiring a specific skill"""
         
-        # Get skill metadata
-        metadata = self.skill_metadata.get(skill, {
-            'difficulty': 'Intermediate',
-            'time_weeks': 12,
-            'impact_multiplier': 1.2
-        })
-        
-        # Calculate projected probability increase
-        base_increase = skill_importance * 0.3  # Base 30% increase for important skills
-        multiplier_bonus = (metadata['impact_multiplier'] - 1.0) * 0.5
-        total_increase = base_increase + multiplier_bonus
-        
-        # Apply diminishing returns for already high probabilities
-        if current_selection_probability > 0.7:
-            total_increase *= 0.7
-        elif current_selection_probability > 0.5:
-            total_increase *= 0.85
-        
-        projected_probability = min(0.95, current_selection_probability + total_increase)
-        
-        # Get course recommendations
-        recommended_courses = self._get_skill_courses(skill)
-        
-        # Generate learning path
-        learning_path = self._generate_learning_path(skill)
-        
-        # Calculate ROI score
-        roi_score = self._calculate_roi_score(skill, total_increase, metadata['time_weeks'])
-        
-        # Format time estimate
-        time_estimate = self._format_time_estimate(metadata['time_weeks'])
-        
-        return SkillImpactSimulation(
-            skill=skill,
-            current_probability=current_selection_probability,
-            projected_probability=projected_probability,
-            probability_increase=total_increase,
-            time_to_acquire=time_estimate,
-            difficulty_level=metadata['difficulty'],
-            recommended_courses=recommended_courses,
-            learning_path=learning_path,
-            roi_score=roi_score
-        )
+        return self._simulate_skills([skill], current_selection_probability, [skill_importance])[0]
+
+    def _simulate_skills(self,
+                         skills: List[str],
+                         current_selection_probability: float,
+                         importances: List[float]) -> List[SkillImpactSimulation]:
+        """Simulate the impact of acquiring each skill, with the numeric work done in one array pass"""
+        
+        keys = [(skill, current_selection_probability, importance)
+                for skill, importance in zip(skills, importances)]
+        with self._simulation_lock:
+            cached = [self._simulation_cache.get(key) for key in keys]
+        
+        # Simulate only the uncached skills, in one array pass
+        missing = [idx for idx, fields in enumerate(cached) if fields is None]
+        if missing:
+            # Resolve each skill name to its row id once; everything below indexes by id
+            skill_ids = [_SKILL_ROW.get(skills[idx], _DEFAULT_ROW) for idx in missing]
+            rows = np.array(skill_ids, dtype=np.intp)
+            total_increase, projected_probability, roi_score = _simulate_impact(
+                np.asarray([importances[idx] for idx in missing], dtype=float),
+                _IMPACT_MULTIPLIER[rows],
+                _TIME_WEEKS[rows],
+                _DEMAND_SCORE[rows],
+                _SALARY_IMPACT[rows],
+                current_selection_probability
+            )
+            
+            for pos, idx in enumerate(missing):
+                time_weeks, difficulty = _SKILL_PROFILE[skill_ids[pos]]
+                cached[idx] = (
+                    float(projected_probability[pos]),
+                    float(total_increase[pos]),
+                    time_weeks,
+                    difficulty,
+                    tuple(self._generate_learning_path(skills[idx])),
+                    float(roi_score[pos])
+                )
+            
+            with self._simulation_lock:
+                for idx in missing:
+                    self._simulation_cache[keys[idx]] = cached[idx]
+                while len(self._simulation_cache) > _SIMULATION_CACHE_SIZE:
+                    self._simulation_cache.popitem(last=False)
+        
+        simulations = []
+        for skill, (projected, increase, weeks, difficulty, learning_path, roi) in zip(skills, cached):
+            simulations.append(SkillImpactSimulation(
+                skill=skill,
+                current_probability=current_selection_probability,
+                projected_probability=projected,
+                probability_increase=increase,
+                time_to_acquire=_format_time_estimate(weeks),
+                difficulty_level=difficulty,
+                recommended_courses=self._get_skill_courses(skill),
+                learning_path=list(learning_path),
+                roi_score=roi,
+                weeks=weeks
+            ))
+        
+        return simulations
 
     def _get_skill_courses(self, skill: str) -> List[CourseRecommendation]:
         """Get course recommendations for a specific skill"""
         
-        all_courses = []
-        
-        # Search across all course databases
-        for provider, courses_db in self.course_databases.items():
-            if skill in courses_db:
-                all_courses.extend(courses_db[skill])
+        # Courses from all providers, already ranked by relevance
+        indexed_courses = self._skill_index.get(skill)
+        if indexed_courses:
+            return list(indexed_courses)
         
         # If no specific courses found, generate generic recommendations
-        if not all_courses:
-            all_courses = [
-                CourseRecommendation(
-                    title=f"Learn {skill} - Complete Guide",
-                    provider="Multiple Platforms",
-                    url=f"https://search.com/courses/{skill.lower().replace(' ', '-')}",
-                    duration="8-12 weeks",
-                    difficulty=self.skill_metadata.get(skill, {}).get('difficulty', 'Intermediate'),
-                    rating=4.5,
-                    price="$50-100",
-                    skills_covered=[skill],
-                    description=f"Comprehensive {skill} training course",
-                    relevance_score=0.8
-                )
-            ]
-        
-        # Sort by relevance score
-        all_courses.sort(key=lambda x: x.relevance_score, reverse=True)
-        
-        return all_courses[:3]  # Return top 3 courses
+        return [
+            CourseRecommendation(
+                title=f"Learn {skill} - Complete Guide",
+                provider="Multiple Platforms",
+                url=f"https://search.com/courses/{skill.lower().replace(' ', '-')}",
+                duration="8-12 weeks",
+                difficulty=_SKILL_METADATA.get(skill, _DEFAULT_META)['difficulty'],
+                rating=4.5,
+                price="$50-100",
+                skills_covered=[skill],
+                description=f"Comprehensive {skill} training course",
+                relevance_score=0.8
+            )
+        ]
 
     def _generate_learning_path(self, skill: str) -> List[str]:
         """Generate a learning path for acquiring a skill"""
         
-        learning_paths = {
-            'Python': [
-                "1. Python Basics & Syntax",
-                "2. Data Structures & Algorithms",
-                "3. Object-Oriented Programming",
-                "4. Libraries & Frameworks",
-                "5. Build Projects & Portfolio"
-            ],
-            'React': [
-                "1. JavaScript ES6+ Fundamentals",
-                "2. React Components & JSX",
-                "3. State Management & Hooks",
-                "4. Routing & Navigation",
-                "5. Build Full-Stack Applications"
-            ],
-            'AWS': [
-                "1. Cloud Computing Fundamentals",
-                "2. Core AWS Services (EC2, S3, IAM)",
-                "3. Networking & Security",
-                "4. DevOps & Automation",
-                "5. Certification & Advanced Services"
-            ],
-            'Machine Learning': [
-                "1. Statistics & Linear Algebra",
-                "2. Python for Data Science",
-                "3. Supervised Learning Algorithms",
-                "4. Unsupervised Learning & Deep Learning",
-                "5. MLOps & Production Deployment"
-            ],
-            'Docker': [
-                "1. Containerization Concepts",
-                "2. Docker Basics & Commands",
-                "3. Dockerfile & Image Creation",
-                "4. Docker Compose & Networking",
-                "5. Production Deployment & Orchestration"
-            ]
-        }
+        learning_path = _LEARNING_PATHS.get(skill)
+        if learning_path is not None:
+            return list(learning_path)
         
         # Default learning path for unlisted skills
-        default_path = [
+        return [
             f"1. {skill} Fundamentals",
             f"2. Core {skill} Concepts",
             f"3. Intermediate {skill} Topics",
             f"4. Advanced {skill} Applications",
             f"5. {skill} Projects & Portfolio"
         ]
-        
-        return learning_paths.get(skill, default_path)
-
-    def _calculate_roi_score(self, skill: str, probability_increase: float, time_weeks: int) -> float:
-        """Calculate Return on Investment score for learning a skill"""
-        
-        # Get market data
-        market_info = self.market_data.get(skill, {
-            'demand_score': 0.7,
-            'salary_impact': 10000
-        })
-        
-        # ROI factors
-        impact_factor = probability_increase * 10  # Convert to 0-10 scale
-        demand_factor = market_info['demand_score'] * 5  # Convert to 0-5 scale
-        time_factor = max(1, 10 - (time_weeks / 4))  # Penalty for longer learning time
-        salary_factor = min(5, market_info['salary_impact'] / 5000)  # Salary impact factor
-        
-        # Calculate weighted ROI score
-        roi_score = (
-            impact_factor * 0.3 +
-            demand_factor * 0.25 +
-            time_factor * 0.2 +
-            salary_factor * 0.25
-        )
-        
-        return min(10.0, roi_score)
-
-    def _format_time_estimate(self, weeks: int) -> str:
-        """Format time estimate in human-readable format"""
-        
-        if weeks <= 4:
-            return f"{weeks} weeks (1 month)"
-        elif weeks <= 12:
-            months = round(weeks / 4)
-            return f"{weeks} weeks ({months} months)"
-        else:
-            months = round(weeks / 4)
-            return f"{weeks} weeks ({months} months)"
 
     def create_upskilling_plan(self,
                              missing_skills: List[str],
@@ -431,36 +538,36 @@ class UpskillingEngine:
                              time_constraint: Optional[int] = None) -> UpskillingPlan:
         """Create a comprehensive upskilling plan"""
         
-        # Simulate impact for each missing skill
-        skill_simulations = []
-        for skill in missing_skills:
-            importance = skill_importance_map.get(skill, 0.7)
-            simulation = self.simulate_skill_impact(skill, current_probability, importance)
-            skill_simulations.append(simulation)
+        # Simulate impact for all missing skills at once
+        skill_simulations = self._simulate_skills(
+            missing_skills,
+            current_probability,
+            [skill_importance_map.get(skill, 0.7) for skill in missing_skills]
+        )
+        
+        # Columns of (roi, weeks, probability increase) for sorting and filtering
+        columns = np.array(
+            [(sim.roi_score, sim.weeks, sim.probability_increase) for sim in skill_simulations], dtype=float
+        ).reshape(-1, 3)
         
-        # Sort by ROI score
-        skill_simulations.sort(key=lambda x: x.roi_score, reverse=True)
+        # Sort by ROI score (stable, so ties keep their input order)
+        order = np.argsort(-columns[:, 0], kind='stable')
+        skill_simulations = [skill_simulations[idx] for idx in order]
+        roi_scores, weeks, probability_increase = columns[order].T
         
         # Prioritize skills based on multiple factors
         prioritized_skills = self._prioritize_skills(skill_simulations, time_constraint)
         
         # Identify quick wins (high impact, low time investment)
-        quick_wins = [
-            sim.skill for sim in skill_simulations
-            if sim.roi_score > 7.0 and 'weeks' in sim.time_to_acquire and
-            int(sim.time_to_acquire.split()[0]) <= 8
-        ]
+        quick_wins = [skill_simulations[idx].skill
+                      for idx in np.flatnonzero((roi_scores > 7.0) & (weeks <= 8))]
         
         # Identify long-term goals (high impact, high time investment)
-        long_term_goals = [
-            sim.skill for sim in skill_simulations
-            if sim.probability_increase > 0.2 and 'weeks' in sim.time_to_acquire and
-            int(sim.time_to_acquire.split()[0]) > 16
-        ]
+        long_term_goals = [skill_simulations[idx].skill
+                           for idx in np.flatnonzero((probability_increase > 0.2) & (weeks > 16))]
         
         # Calculate total time and budget estimates
-        total_time_estimate = self._calculate_total_time(skill_simulations[:5])  # Top 5 skills
-        budget_estimate = self._calculate_budget_estimate(skill_simulations[:5])
+        total_time_estimate, budget_estimate = self._summarize_top(skill_simulations[:5])  # Top 5 skills
         
         return UpskillingPlan(
             skill_simulations=skill_simulations,
@@ -476,98 +583,76 @@ class UpskillingEngine:
                           time_constraint: Optional[int]) -> List[str]:
         """Prioritize skills based on ROI, prerequisites, and time constraints"""
         
-        # Create dependency graph
-        skill_deps = {}
-        for sim in simulations:
-            skill_deps[sim.skill] = self.skill_prerequisites.get(sim.skill, [])
-        
         # If time constraint is specified, filter skills
         if time_constraint:
-            filtered_sims = []
-            for sim in simulations:
-                weeks_needed = int(sim.time_to_acquire.split()[0])
-                if weeks_needed <= time_constraint:
-                    filtered_sims.append(sim)
-            simulations = filtered_sims
-        
-        # Sort by ROI score and resolve dependencies
-        prioritized = []
+            simulations = [sim for sim in simulations if sim.weeks <= time_constraint]
+        
         remaining_skills = {sim.skill: sim for sim in simulations}
         
+        # Without prerequisites the ordering is just ROI, highest first (stable for ties)
+        if not any(skill in _SKILL_PREREQS for skill in remaining_skills):
+            return sorted(remaining_skills, key=lambda skill: -remaining_skills[skill].roi_score)
+        
+        # Resolve dependencies with Kahn's algorithm, taking the highest-ROI ready skill first
+        prioritized = []
+        order = {skill: idx for idx, skill in enumerate(remaining_skills)}
+        
+        # In-degree counts only prerequisites that are themselves in the plan
+        indegree = {}
+        dependents = defaultdict(list)
+        for skill in remaining_skills:
+            unmet_deps = [dep for dep in _SKILL_PREREQS.get(skill, ()) if dep in remaining_skills]
+            indegree[skill] = len(unmet_deps)
+            for dep in unmet_deps:
+                dependents[dep].append(skill)
+        
+        # Heap keyed by (-roi, original order) so ties keep simulation order
+        ready = [(-sim.roi_score, order[skill], skill)
+                 for skill, sim in remaining_skills.items() if not indegree[skill]]
+        heapq.heapify(ready)
+        
         while remaining_skills:
-            # Find skills with no unmet dependencies
-            ready_skills = []
-            for skill, sim in remaining_skills.items():
-                deps = skill_deps.get(skill, [])
-                unmet_deps = [dep for dep in deps if dep in remaining_skills]
-                if not unmet_deps:
-                    ready_skills.append((skill, sim))
-            
-            if not ready_skills:
+            if ready:
+                _, _, best_skill = heapq.heappop(ready)
+            else:
                 # If circular dependencies, just pick highest ROI
-                skill, sim = max(remaining_skills.items(), key=lambda x: x[1].roi_score)
-                ready_skills = [(skill, sim)]
-            
-            # Sort ready skills by ROI and add the best one
-            ready_skills.sort(key=lambda x: x[1].roi_score, reverse=True)
-            best_skill, _ = ready_skills[0]
+                best_skill = min(remaining_skills,
+                                 key=lambda skill: (-remaining_skills[skill].roi_score, order[skill]))
             
             prioritized.append(best_skill)
             del remaining_skills[best_skill]
+            
+            for dependent in dependents.get(best_skill, ()):
+                if dependent in remaining_skills:
+                    indegree[dependent] -= 1
+                    if not indegree[dependent]:
+                        heapq.heappush(ready, (-remaining_skills[dependent].roi_score, order[dependent], dependent))
         
         return prioritized
 
-    def _calculate_total_time(self, simulations: List[SkillImpactSimulation]) -> str:
-        """Calculate total time estimate for multiple skills"""
+    def _summarize_top(self, simulations: List[SkillImpactSimulation]) -> Tuple[str, str]:
+        """Total time and budget estimates for the given skills, in one pass"""
         
         total_weeks = 0
+        total_cost = 0.0
+        priced = False
         for sim in simulations:
-            weeks = int(sim.time_to_acquire.split()[0])
-            total_weeks += weeks
+            total_weeks += sim.weeks
+            if sim.recommended_courses:
+                # Use first recommended course
+                total_cost += _parse_price(sim.recommended_courses[0].price)
+                priced = True
         
         # Assume 25% overlap/parallel learning
-        adjusted_weeks = int(total_weeks * 0.75)
+        total_time_estimate = _format_time_estimate(int(total_weeks * 0.75))
         
-        return self._format_time_estimate(adjusted_weeks)
-
-    def _calculate_budget_estimate(self, simulations: List[SkillImpactSimulation]) -> str:
-        """Calculate budget estimate for course recommendations"""
-        
-        total_cost = 0
-        cost_ranges = []
-        
-        for sim in simulations:
-            if sim.recommended_courses:
-                course = sim.recommended_courses[0]  # Use first recommended course
-                price_str = course.price
-                
-                # Extract numeric cost (simplified parsing)
-                if 'free' in price_str.lower():
-                    cost = 0
-                elif '$' in price_str:
-                    # Extract first number after $
-                    import re
-                    numbers = re.findall(r'\$(\d+(?:\.\d+)?)', price_str)
-                    if numbers:
-                        cost = float(numbers[0])
-                        # If it's monthly, assume 3 months
-                        if 'month' in price_str.lower():
-                            cost *= 3
-                    else:
-                        cost = 100  # Default estimate
-                else:
-                    cost = 100  # Default estimate
-                
-                total_cost += cost
-                cost_ranges.append(cost)
-        
-        if not cost_ranges:
-            return "$500 - $1,500"
+        if not priced:
+            return total_time_estimate, "$500 - $1,500"
         
         min_cost = int(total_cost * 0.7)
         max_cost = int(total_cost * 1.3)
         
-        return f"${min_cost} - ${max_cost}"
+        return total_time_estimate, f"${min_cost} - ${max_cost}"
 
     def get_skill_alternatives(self, skill: str) -> List[str]:
         """Get alternative skills that provide similar value"""
@@ -592,7 +677,10 @@ class UpskillingEngine:
         """Export upskilling plan in specified format"""
         
         if format == 'json':
-            return json.dumps(asdict(plan), indent=2, default=str)
+            if orjson is not None:
+                # Serializes the dataclass tree directly, without building an intermediate dict
+                return orjson.dumps(plan, option=orjson.OPT_INDENT_2, default=str).decode()
+            return json.dumps(_to_dict(plan), indent=2, default=str)
         
         elif format == 'summary':
             summary = f"""
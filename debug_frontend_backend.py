@@ -3,9 +3,30 @@ Debug Frontend-Backend Data Transfer
 Test the actual data flow between frontend and backend
 """
 
+import io
 import requests
-import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding
+    orjson = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # optional: streamed multipart uploads
+    MultipartEncoder = None
+
+def _response_json(response):
+    """Decode a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _request(method, url, **kwargs):
+    """Send one request on its own Session; Sessions are not shared across threads"""
+    with requests.Session() as worker_session:
+        return worker_session.request(method, url, **kwargs)
 
 def debug_data_transfer():
     base_url = "http://localhost:9002"
@@ -33,17 +54,23 @@ SQL
     
     # Step 1: Test upload
     print("\n1. Testing file upload...")
-    test_file_path = Path("debug_resume.txt")
-    with open(test_file_path, 'w') as f:
-        f.write(test_resume_content)
+    # Keep-alive session for the sequential API calls
+    session = requests.Session()
     
     try:
-        with open(test_file_path, 'rb') as f:
-            files = {'file': ('debug_resume.txt', f, 'text/plain')}
-            upload_response = requests.post(f"{base_url}/upload_resume", files=files)
+        # Upload straight from memory; no temporary file on disk
+        resume_file = io.BytesIO(test_resume_content.encode('utf-8'))
+        if MultipartEncoder is not None:
+            # Stream the multipart body instead of buffering it
+            encoder = MultipartEncoder(fields={'file': ('debug_resume.txt', resume_file, 'text/plain')})
+            upload_response = session.post(f"{base_url}/upload_resume", data=encoder,
+                                           headers={'Content-Type': encoder.content_type})
+        else:
+            files = {'file': ('debug_resume.txt', resume_file, 'text/plain')}
+            upload_response = session.post(f"{base_url}/upload_resume", files=files)
         
         print(f"Upload Status: {upload_response.status_code}")
-        upload_result = upload_response.json()
+        upload_result = _response_json(upload_response)
         print(f"Upload Success: {upload_result.get('success')}")
         print(f"Skills Found: {len(upload_result.get('extracted_skills', []))}")
         print(f"Extracted Skills: {upload_result.get('extracted_skills', [])}")
@@ -61,11 +88,18 @@ SQL
                 'job_description': job_desc
             }
             
-            analysis_response = requests.post(f"{base_url}/analyze_resume", data=analysis_data)
+            # Analysis and job matching only depend on file_id, so run them concurrently,
+            # each worker on its own Session
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                analysis_future = executor.submit(_request, 'POST', f"{base_url}/analyze_resume", data=analysis_data)
+                matches_future = executor.submit(_request, 'GET', f"{base_url}/match_jobs", params={'file_id': file_id})
+                analysis_response = analysis_future.result()
+                matches_response = matches_future.result()
+            
             print(f"Analysis Status: {analysis_response.status_code}")
             
             if analysis_response.status_code == 200:
-                analysis_result = analysis_response.json()
+                analysis_result = _response_json(analysis_response)
                 print(f"Analysis Success: {analysis_result.get('success')}")
                 
                 if analysis_result.get('success'):
@@ -83,11 +117,10 @@ SQL
             
             # Step 3: Test job matching
             print(f"\n3. Testing job matching...")
-            matches_response = requests.get(f"{base_url}/match_jobs?file_id={file_id}")
             print(f"Matches Status: {matches_response.status_code}")
             
             if matches_response.status_code == 200:
-                matches_result = matches_response.json()
+                matches_result = _response_json(matches_response)
                 print(f"Matches Success: {matches_result.get('success')}")
                 print(f"Eligible Jobs: {matches_result.get('eligible_matches', 0)}")
                 print(f"Total Jobs: {matches_result.get('total_matches', 0)}")
@@ -106,8 +139,7 @@ SQL
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        if test_file_path.exists():
-            test_file_path.unlink()
+        session.close()
     
     # Step 4: Test direct skill extraction
     print(f"\n4. Testing direct skill extraction...")
@@ -3,7 +3,14 @@ Debug Skill Extraction
 """
 
 import re
-from typing import List, Dict, Any
+import sys
+import logging
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+import ahocorasick
+
+logger = logging.getLogger(__name__)
 
 # Sample skills database for testing
 COMPREHENSIVE_SKILLS_DB = {
@@ -21,82 +28,116 @@ COMPREHENSIVE_SKILLS_DB = {
     ]
 }
 
+# Text normalization patterns
+_NON_SKILL_CHARS_RE = re.compile(r'[^\w\s+#.-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Table form of _NON_SKILL_CHARS_RE for ASCII text
+_NON_SKILL_CHARS_TO_SPACE = str.maketrans({
+    char: ' ' for char in map(chr, range(128))
+    if not (char.isalnum() or char == '_' or char.isspace() or char in '+#.-')
+})
+
+# Flat (category, skill, lowercase skill) entries in database order; skill names
+# are interned so every result shares one string object per skill
+_SKILL_ENTRIES = [
+    (sys.intern(category), sys.intern(skill), skill.lower())
+    for category, skills_list in COMPREHENSIVE_SKILLS_DB.items()
+    for skill in skills_list
+]
+
+def _build_skill_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over all lowercase skill names"""
+    automaton = ahocorasick.Automaton()
+    for skill_id, (_, _, skill_lower) in enumerate(_SKILL_ENTRIES):
+        automaton.add_word(skill_lower, (skill_id, len(skill_lower)))
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w"""
+    return char.isalnum() or char == '_'
+
+def _is_skill_match(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is a whole skill mention, i.e. (?<!\\w)skill(?!\\w)"""
+    return ((start == 0 or not _is_word_char(text[start - 1])) and
+            (end == len(text) or not _is_word_char(text[end])))
+
+@lru_cache(maxsize=64)
+def _normalize_text(text: str) -> str:
+    """Lowercase text with non-skill characters blanked and whitespace collapsed"""
+    text_lower = text.lower()
+    if text_lower.isascii():
+        text_normalized = text_lower.translate(_NON_SKILL_CHARS_TO_SPACE)
+    else:
+        text_normalized = _NON_SKILL_CHARS_RE.sub(' ', text_lower)
+    return _WHITESPACE_RE.sub(' ', text_normalized)
+
 def extract_skills_enhanced(text: str):
     """Enhanced skill extraction with exact matching and categorization"""
-    print(f"Input text: {text[:200]}...")
+    logger.debug("Input text: %.200s...", text)
     
-    text_lower = text.lower()
-    print(f"Text lower: {text_lower[:200]}...")
-    
-    # Clean and normalize text
-    text_normalized = re.sub(r'[^\w\s+#.-]', ' ', text_lower)
-    text_normalized = re.sub(r'\s+', ' ', text_normalized)
-    print(f"Text normalized: {text_normalized[:200]}...")
+    # Clean and normalize text (cached for repeated documents)
+    text_normalized = _normalize_text(text)
+    logger.debug("Text normalized: %.200s...", text_normalized)
     
     categorized_skills = {}
     all_found_skills = []
     
-    for category, skills_list in COMPREHENSIVE_SKILLS_DB.items():
-        found_skills = []
-        print(f"\nChecking category: {category}")
-        
-        for skill in skills_list:
-            skill_lower = skill.lower()
-            skill_patterns = [
-                rf'\b{re.escape(skill_lower)}\b',  # Exact word match
-                rf'{re.escape(skill_lower)}(?:\s|$|,|\.|;)',  # Word boundary
-                rf'(?:^|\s){re.escape(skill_lower)}(?:\s|$)',  # Start/end boundary
-            ]
-            
-            # Special handling for compound skills
-            if any(char in skill_lower for char in ['.', '+', '#', '-']):
-                skill_patterns.append(re.escape(skill_lower))
-            
-            for pattern in skill_patterns:
-                if re.search(pattern, text_normalized):
-                    if skill not in found_skills:
-                        found_skills.append(skill)
-                        all_found_skills.append(skill)
-                        print(f"  Found skill: {skill} (pattern: {pattern})")
-                    break
-        
-        if found_skills:
-            categorized_skills[category] = found_skills
+    # One pass over the text finds every occurrence of every skill
+    found_ids = set()
+    for end_index, (skill_id, skill_len) in _SKILL_AUTOMATON.iter(text_normalized):
+        # Later occurrences of a confirmed skill need no boundary check
+        if skill_id in found_ids:
+            continue
+        if _is_skill_match(text_normalized, end_index + 1 - skill_len, end_index + 1):
+            found_ids.add(skill_id)
+            # Stop scanning once every skill has been confirmed
+            if len(found_ids) == len(_SKILL_ENTRIES):
+                break
+    
+    # Report in database order
+    for skill_id, (category, skill, _) in enumerate(_SKILL_ENTRIES):
+        if skill_id in found_ids:
+            categorized_skills.setdefault(category, []).append(skill)
+            all_found_skills.append(skill)
     
-    print(f"\nFinal results:")
-    print(f"Categorized skills: {categorized_skills}")
-    print(f"All found skills: {all_found_skills}")
+    logger.debug("Categorized skills: %s", categorized_skills)
+    logger.debug("All found skills: %s", all_found_skills)
     
     return categorized_skills, all_found_skills
 
-# Test with sample resume text
-test_resume = """
+def extract_skills_batch(texts: List[str]) -> List[Tuple[Dict[str, List[str]], List[str]]]:
+    """Skill extraction over many documents, one automaton pass per document"""
+    return [extract_skills_enhanced(text) for text in texts]
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    
+    # Test with sample resume text
+    test_resume = """
 John Doe
 Software Engineer
 Skills: Python, JavaScript, React, Machine Learning, R programming
 Experience with TensorFlow and data analysis
 """
-
-test_job = """
+    
+    test_job = """
 Looking for developer with Python, React, Machine Learning experience
 """
-
-print("=== TESTING SKILL EXTRACTION ===")
-resume_cats, resume_skills = extract_skills_enhanced(test_resume)
-job_cats, job_skills = extract_skills_enhanced(test_job)
-
-print(f"\nResume skills: {resume_skills}")
-print(f"Job skills: {job_skills}")
-
-# Test matching
-matched_skills = []
-missing_skills = []
-
-for job_skill in job_skills:
-    if job_skill in resume_skills:
-        matched_skills.append(job_skill)
-    else:
-        missing_skills.append(job_skill)
-
-print(f"\nMatched: {matched_skills}")
-print(f"Missing: {missing_skills}")
+    
+    print("=== TESTING SKILL EXTRACTION ===")
+    resume_cats, resume_skills = extract_skills_enhanced(test_resume)
+    job_cats, job_skills = extract_skills_enhanced(test_job)
+    
+    print(f"\nResume skills: {resume_skills}")
+    print(f"Job skills: {job_skills}")
+    
+    # Test matching (set membership, keeping job skill order)
+    resume_skill_set = set(resume_skills)
+    matched_skills = [job_skill for job_skill in job_skills if job_skill in resume_skill_set]
+    missing_skills = [job_skill for job_skill in job_skills if job_skill not in resume_skill_set]
+    
+    print(f"\nMatched: {matched_skills}")
+    print(f"Missing: {missing_skills}")
@@ -4,20 +4,25 @@ Real-time skill matching with exact percentages and company data
 """
 
 import os
+import asyncio
+import hashlib
 import logging
 import tempfile
-import shutil
 import json
 import re
-from typing import List, Dict, Any, Optional, Set
+import time
+from typing import List, Dict, Any, Optional, Set, FrozenSet
 from pathlib import Path
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 import math
 
+import aiofiles
+import ahocorasick
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import uvicorn
@@ -30,7 +35,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Enhanced AI Resume Analyzer API",
     description="Advanced AI-powered resume analysis with real-time matching",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -46,8 +52,40 @@ app.add_middleware(
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-# Global storage
-uploaded_files = {}
+# Upload read size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Global storage, oldest entries evicted beyond MAX_FILES
+MAX_FILES = 256
+uploaded_files: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Analysis results per (file_id, job description digest), oldest evicted first,
+# with each file's cached digests so they can be dropped along with the file
+MAX_CACHED_ANALYSES = 1024
+analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+analysis_digests: Dict[str, Set[bytes]] = {}
+
+def _evict_oldest_upload() -> None:
+    """Drop the least recently used upload, its cached analyses and its stored file"""
+    file_id, file_info = uploaded_files.popitem(last=False)
+    for digest in analysis_digests.pop(file_id, ()):
+        del analysis_cache[(file_id, digest)]
+    try:
+        Path(file_info["file_path"]).unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not delete evicted upload {file_info['file_path']}: {e}")
+
+def _cache_analysis(cache_key: tuple, analysis: Dict[str, Any]) -> None:
+    """Store an analysis result, evicting the least recently used one beyond the cap"""
+    file_id, digest = cache_key
+    analysis_cache[cache_key] = analysis
+    analysis_digests.setdefault(file_id, set()).add(digest)
+    if len(analysis_cache) > MAX_CACHED_ANALYSES:
+        (old_file_id, old_digest), _ = analysis_cache.popitem(last=False)
+        old_digests = analysis_digests[old_file_id]
+        old_digests.discard(old_digest)
+        if not old_digests:
+            del analysis_digests[old_file_id]
 
 # Enhanced Skills Database with Categories
 COMPREHENSIVE_SKILLS_DB = {
@@ -104,6 +142,42 @@ COMPREHENSIVE_SKILLS_DB = {
     ]
 }
 
+# Keywords counted (once each) by the experience heuristic
+_EXPERIENCE_KEYWORDS = ("years", "experience", "worked", "developed", "managed", "led", "created")
+
+# Text normalization patterns
+_NON_WORD_RE = re.compile(r'[^\w\s+#.-]')
+_WS_RE = re.compile(r'\s+')
+# ASCII equivalent of _NON_WORD_RE as a single translate table
+_NON_WORD_TO_SPACE = str.maketrans({
+    char: ' ' for char in map(chr, range(128))
+    if not (char.isalnum() or char == '_' or char.isspace() or char in '+#.-')
+})
+
+# Flat (category, skill, term id) entries in database order. Skills listed under
+# several categories share one term, since they match identically
+_SKILL_TERMS = list(dict.fromkeys(
+    skill.lower() for skills_list in COMPREHENSIVE_SKILLS_DB.values() for skill in skills_list
+))
+_TERM_IDS = {term: term_id for term_id, term in enumerate(_SKILL_TERMS)}
+_SKILL_ENTRIES = [
+    (category, skill, _TERM_IDS[skill.lower()])
+    for category, skills_list in COMPREHENSIVE_SKILLS_DB.items()
+    for skill in skills_list
+]
+# Compound skills (containing . + # -) match anywhere in the text
+_TERM_IS_COMPOUND = [any(char in term for char in '.+#-') for term in _SKILL_TERMS]
+
+def _build_skill_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over all lowercase skill names"""
+    automaton = ahocorasick.Automaton()
+    for term_id, term in enumerate(_SKILL_TERMS):
+        automaton.add_word(term, (term_id, len(term)))
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
 # Real Company Data with Job Openings
 REAL_COMPANY_JOBS = [
     {
@@ -208,6 +282,33 @@ REAL_COMPANY_JOBS = [
     }
 ]
 
+# One bit per distinct job skill name; job skill lists hold distinct names, so
+# popcounts of masked resume skills equal the per-skill match counts
+_JOB_SKILL_BITS = {
+    skill: 1 << bit
+    for bit, skill in enumerate(dict.fromkeys(
+        skill
+        for job in REAL_COMPANY_JOBS
+        for skill in job["required_skills"] + job.get("preferred_skills", [])
+    ))
+}
+
+def _skill_mask(skills: List[str]) -> int:
+    """Bitmask of the job skills named in skills (exact, case-sensitive names)"""
+    mask = 0
+    for skill in skills:
+        mask |= _JOB_SKILL_BITS.get(skill, 0)
+    return mask
+
+# Per-job (job, all job skills, lowercase skill set, required mask, preferred mask),
+# computed once for matching
+_JOB_INDEX = [
+    (job, all_job_skills, frozenset(skill.lower() for skill in all_job_skills),
+     _skill_mask(job["required_skills"]), _skill_mask(job.get("preferred_skills", [])))
+    for job in REAL_COMPANY_JOBS
+    for all_job_skills in [job["required_skills"] + job.get("preferred_skills", [])]
+]
+
 # Pydantic Models
 class UploadResponse(BaseModel):
     success: bool
@@ -255,9 +356,7 @@ def extract_text_simple(file_path: str, file_extension: str) -> str:
             try:
                 import fitz  # PyMuPDF
                 doc = fitz.open(file_path)
-                text = ""
-                for page in doc:
-                    text += page.get_text()
+                text = "".join(page.get_text() for page in doc)
                 doc.close()
                 return text
             except ImportError:
@@ -266,10 +365,7 @@ def extract_text_simple(file_path: str, file_extension: str) -> str:
             try:
                 from docx import Document
                 doc = Document(file_path)
-                text = ""
-                for paragraph in doc.paragraphs:
-                    text += paragraph.text + "\n"
-                return text
+                return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
             except ImportError:
                 return "DOCX processing requires python-docx. Install with: pip install python-docx"
         else:
@@ -277,49 +373,65 @@ def extract_text_simple(file_path: str, file_extension: str) -> str:
     except Exception as e:
         return f"Error extracting text: {str(e)}"
 
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w"""
+    return char.isalnum() or char == '_'
+
+def _is_skill_match(text: str, start: int, end: int, compound: bool) -> bool:
+    """Whether the occurrence text[start:end] counts as a skill mention"""
+    if compound:
+        return True
+    # Followed by end of text, whitespace or a period
+    if end == len(text) or text[end] in ' .':
+        return True
+    # Otherwise both ends must sit on word boundaries
+    return (start == 0 or not _is_word_char(text[start - 1])) and not _is_word_char(text[end])
+
+def _normalize_text(text: str) -> str:
+    """Lowercase text with non-skill characters blanked and whitespace collapsed"""
+    text_lower = text.lower()
+    if text_lower.isascii():
+        text_normalized = text_lower.translate(_NON_WORD_TO_SPACE)
+    else:
+        text_normalized = _NON_WORD_RE.sub(' ', text_lower)
+    return _WS_RE.sub(' ', text_normalized)
+
 def extract_skills_enhanced(text: str) -> Dict[str, List[str]]:
     """Enhanced skill extraction with exact matching and categorization"""
-    text_lower = text.lower()
-    
     # Clean and normalize text
-    text_normalized = re.sub(r'[^\w\s+#.-]', ' ', text_lower)
-    text_normalized = re.sub(r'\s+', ' ', text_normalized)
+    text_normalized = _normalize_text(text)
     
     categorized_skills = {}
     all_found_skills = []
     
-    for category, skills_list in COMPREHENSIVE_SKILLS_DB.items():
-        found_skills = []
-        
-        for skill in skills_list:
-            skill_lower = skill.lower()
-            skill_patterns = [
-                rf'\b{re.escape(skill_lower)}\b',  # Exact word match
-                rf'{re.escape(skill_lower)}(?:\s|$|,|\.|;)',  # Word boundary
-                rf'(?:^|\s){re.escape(skill_lower)}(?:\s|$)',  # Start/end boundary
-            ]
-            
-            # Special handling for compound skills
-            if any(char in skill_lower for char in ['.', '+', '#', '-']):
-                skill_patterns.append(re.escape(skill_lower))
-            
-            for pattern in skill_patterns:
-                if re.search(pattern, text_normalized):
-                    if skill not in found_skills:
-                        found_skills.append(skill)
-                        all_found_skills.append(skill)
-                    break
-        
-        if found_skills:
-            categorized_skills[category] = found_skills
+    # One pass over the text finds every occurrence of every skill
+    found_terms = set()
+    for end_index, (term_id, term_len) in _SKILL_AUTOMATON.iter(text_normalized):
+        if term_id not in found_terms and _is_skill_match(
+            text_normalized, end_index + 1 - term_len, end_index + 1, _TERM_IS_COMPOUND[term_id]
+        ):
+            found_terms.add(term_id)
+            if len(found_terms) == len(_SKILL_TERMS):
+                break
+    
+    # Report in database order; skills in several categories are listed under each
+    for category, skill, term_id in _SKILL_ENTRIES:
+        if term_id in found_terms:
+            categorized_skills.setdefault(category, []).append(skill)
+            all_found_skills.append(skill)
     
     return categorized_skills, all_found_skills
 
 def calculate_exact_match_percentage(resume_skills: List[str], job_skills: List[str]) -> Dict[str, Any]:
     """Calculate exact skill match percentages"""
-    resume_skills_lower = [skill.lower() for skill in resume_skills]
-    job_skills_lower = [skill.lower() for skill in job_skills]
-    
+    return _exact_match(
+        resume_skills, frozenset(skill.lower() for skill in resume_skills),
+        job_skills, frozenset(skill.lower() for skill in job_skills)
+    )
+
+def _exact_match(resume_skills: List[str], resume_skills_lower: FrozenSet[str],
+                 job_skills: List[str], job_skills_lower: FrozenSet[str]) -> Dict[str, Any]:
+    """calculate_exact_match_percentage with precomputed lowercase skill sets"""
     matched_skills = []
     missing_skills = []
     
@@ -330,10 +442,7 @@ def calculate_exact_match_percentage(resume_skills: List[str], job_skills: List[
             missing_skills.append(job_skill)
     
     # Find extra skills (in resume but not in job)
-    extra_skills = []
-    for resume_skill in resume_skills:
-        if resume_skill.lower() not in job_skills_lower:
-            extra_skills.append(resume_skill)
+    extra_skills = [skill for skill in resume_skills if skill.lower() not in job_skills_lower]
     
     total_job_skills = len(job_skills)
     matched_count = len(matched_skills)
@@ -350,11 +459,16 @@ def calculate_exact_match_percentage(resume_skills: List[str], job_skills: List[
         "extra_count": len(extra_skills)
     }
 
-def analyze_resume_comprehensive(resume_text: str, job_description: str) -> Dict[str, Any]:
+def analyze_resume_comprehensive(resume_text: str, job_description: str,
+                                 resume_skill_categories: Optional[Dict[str, List[str]]] = None,
+                                 resume_skills: Optional[List[str]] = None,
+                                 word_count: Optional[int] = None,
+                                 character_count: Optional[int] = None) -> Dict[str, Any]:
     """Comprehensive resume analysis with exact percentages"""
     
-    # Extract skills with categories
-    resume_skill_categories, resume_skills = extract_skills_enhanced(resume_text)
+    # Extract skills with categories, reusing resume skills extracted at upload
+    if resume_skill_categories is None or resume_skills is None:
+        resume_skill_categories, resume_skills = extract_skills_enhanced(resume_text)
     job_skill_categories, job_skills = extract_skills_enhanced(job_description)
     
     # Calculate exact matches
@@ -385,8 +499,8 @@ def analyze_resume_comprehensive(resume_text: str, job_description: str) -> Dict
     extra_skill_boost = min(len(match_analysis["extra_skills"]) * 2, 15)
     
     # Experience factor (simple heuristic based on text length and keywords)
-    experience_keywords = ["years", "experience", "worked", "developed", "managed", "led", "created"]
-    experience_mentions = sum(1 for keyword in experience_keywords if keyword in resume_text.lower())
+    resume_text_lower = resume_text.lower()
+    experience_mentions = sum(1 for keyword in _EXPERIENCE_KEYWORDS if keyword in resume_text_lower)
     experience_factor = min(experience_mentions * 3, 20)
     
     selection_probability = min(base_probability + extra_skill_boost + experience_factor, 95)
@@ -423,6 +537,12 @@ def analyze_resume_comprehensive(resume_text: str, job_description: str) -> Dict
             "priority": "High" if skill in match_analysis["missing_skills"][:2] else "Medium"
         })
     
+    # Resume text stats, reusing the counts stored at upload
+    if word_count is None:
+        word_count = len(resume_text.split())
+    if character_count is None:
+        character_count = len(resume_text.strip())
+    
     return {
         "fit_score": round(fit_score, 1),
         "selection_probability": round(selection_probability, 1),
@@ -437,8 +557,8 @@ def analyze_resume_comprehensive(resume_text: str, job_description: str) -> Dict
         "feedback": feedback,
         "course_recommendations": course_recommendations,
         "resume_stats": {
-            "word_count": len(resume_text.split()),
-            "character_count": len(resume_text.strip()),
+            "word_count": word_count,
+            "character_count": character_count,
             "skill_categories_found": len(resume_skill_categories),
             "total_unique_skills": len(resume_skills)
         }
@@ -447,16 +567,16 @@ def analyze_resume_comprehensive(resume_text: str, job_description: str) -> Dict
 def match_jobs_realtime(resume_skills: List[str]) -> List[JobMatch]:
     """Real-time job matching with exact percentages"""
     matches = []
+    resume_mask = _skill_mask(resume_skills)
+    resume_skills_lower = frozenset(skill.lower() for skill in resume_skills)
     
-    for job in REAL_COMPANY_JOBS:
-        all_job_skills = job["required_skills"] + job.get("preferred_skills", [])
-        
+    for job, all_job_skills, job_skills_lower, required_mask, preferred_mask in _JOB_INDEX:
         # Calculate exact match
-        match_analysis = calculate_exact_match_percentage(resume_skills, all_job_skills)
+        match_analysis = _exact_match(resume_skills, resume_skills_lower, all_job_skills, job_skills_lower)
         
         # Calculate fit score based on required vs preferred skills
-        required_matches = len([skill for skill in job["required_skills"] if skill in resume_skills])
-        preferred_matches = len([skill for skill in job.get("preferred_skills", []) if skill in resume_skills])
+        required_matches = (resume_mask & required_mask).bit_count()
+        preferred_matches = (resume_mask & preferred_mask).bit_count()
         
         required_percentage = (required_matches / len(job["required_skills"]) * 100) if job["required_skills"] else 0
         preferred_percentage = (preferred_matches / len(job.get("preferred_skills", [])) * 100) if job.get("preferred_skills") else 0
@@ -492,10 +612,17 @@ async def root():
     """API root endpoint"""
     return {"message": "Enhanced AI Resume Analyzer API", "version": "3.0.0"}
 
+# (monotonic second, ISO timestamp) last reported by /health
+_health_timestamp = (-1, "")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    global _health_timestamp
+    second = int(time.monotonic())
+    if _health_timestamp[0] != second:
+        _health_timestamp = (second, datetime.now().isoformat())
+    return {"status": "healthy", "timestamp": _health_timestamp[1]}
 
 @app.post("/upload_resume", response_model=UploadResponse)
 async def upload_resume(file: UploadFile = File(...)):
@@ -514,11 +641,12 @@ async def upload_resume(file: UploadFile = File(...)):
         file_id = str(uuid.uuid4())
         file_path = UPLOAD_DIR / f"{file_id}{file_extension}"
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
         
-        extracted_text = extract_text_simple(str(file_path), file_extension)
-        skill_categories, all_skills = extract_skills_enhanced(extracted_text)
+        extracted_text = await asyncio.to_thread(extract_text_simple, str(file_path), file_extension)
+        skill_categories, all_skills = await asyncio.to_thread(extract_skills_enhanced, extracted_text)
         
         uploaded_files[file_id] = {
             "filename": file.filename,
@@ -527,8 +655,12 @@ async def upload_resume(file: UploadFile = File(...)):
             "upload_time": datetime.now().isoformat(),
             "file_size": os.path.getsize(file_path),
             "skills": all_skills,
-            "skill_categories": skill_categories
+            "skill_categories": skill_categories,
+            "word_count": len(extracted_text.split()),
+            "character_count": len(extracted_text.strip())
         }
+        if len(uploaded_files) > MAX_FILES:
+            _evict_oldest_upload()
         
         return UploadResponse(
             success=True,
@@ -538,7 +670,7 @@ async def upload_resume(file: UploadFile = File(...)):
             metadata={
                 "filename": file.filename,
                 "file_size": os.path.getsize(file_path),
-                "word_count": len(extracted_text.split()),
+                "word_count": uploaded_files[file_id]["word_count"],
                 "total_skills_found": len(all_skills),
                 "skill_categories_count": len(skill_categories)
             },
@@ -558,12 +690,23 @@ async def analyze_resume(file_id: str = Form(...), job_description: str = Form(.
         raise HTTPException(status_code=404, detail="File not found")
     
     try:
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         
-        resume_text = uploaded_files[file_id]["extracted_text"]
-        analysis = analyze_resume_comprehensive(resume_text, job_description)
+        uploaded_files.move_to_end(file_id)
+        cache_key = (file_id, hashlib.blake2b(job_description.encode('utf-8')).digest())
+        analysis = analysis_cache.get(cache_key)
+        if analysis is None:
+            file_info = uploaded_files[file_id]
+            analysis = analyze_resume_comprehensive(
+                file_info["extracted_text"], job_description,
+                file_info["skill_categories"], file_info["skills"],
+                file_info["word_count"], file_info["character_count"]
+            )
+            _cache_analysis(cache_key, analysis)
+        else:
+            analysis_cache.move_to_end(cache_key)
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_time) / 1e9
         
         return AnalysisResponse(
             success=True,
@@ -584,6 +727,7 @@ async def match_jobs(file_id: str):
         raise HTTPException(status_code=404, detail="File not found")
     
     try:
+        uploaded_files.move_to_end(file_id)
         resume_skills = uploaded_files[file_id]["skills"]
         matches = match_jobs_realtime(resume_skills)
         
@@ -22,7 +22,7 @@ import uvicorn
 from core.document_processor import DocumentProcessor, ExtractedData
 from core.nlp_engine import NLPEngine
 from core.prediction_model import SelectionPredictor, PredictionFeatures
-from core.skill_analyzer import SkillAnalyzer, SkillGapAnalysis
+from core.skill_analyzer import SkillGapAnalysis, get_default_analyzer
 from core.upskilling_engine import UpskillingEngine, UpskillingPlan
 from core.feedback_generator import FeedbackGenerator, ResumeAnalysis
 from core.role_matcher import RoleMatcher, RoleMatchingResults
@@ -120,7 +120,7 @@ async def startup_event():
         prediction_model.train_model()
         logger.info("✓ Prediction model initialized and trained")
         
-        skill_analyzer = SkillAnalyzer()
+        skill_analyzer = get_default_analyzer()
         logger.info("✓ Skill analyzer initialized")
         
         upskilling_engine = UpskillingEngine()